@@ -10,6 +10,7 @@ import os
 import sys
 from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
+from functools import cache
 from typing import Any
 
 from dotenv import find_dotenv, load_dotenv
@@ -731,52 +732,56 @@ class HindsightConfig:
     # Class-level sets for configuration categorization
 
     # CREDENTIAL_FIELDS: Never exposed via API, never configurable per-tenant/bank
-    _CREDENTIAL_FIELDS = {
-        # API Keys
-        "llm_api_key",
-        "retain_llm_api_key",
-        "reflect_llm_api_key",
-        "consolidation_llm_api_key",
-        # Base URLs (could expose infrastructure)
-        "llm_base_url",
-        "retain_llm_base_url",
-        "reflect_llm_base_url",
-        "consolidation_llm_base_url",
-        "embeddings_tei_base_url",
-        "reranker_tei_base_url",
-        "reranker_cohere_base_url",
-        # Service Account Keys
-        "llm_vertexai_service_account_key",
-        # File storage credentials
-        "file_storage_s3_access_key_id",
-        "file_storage_s3_secret_access_key",
-        "file_storage_gcs_service_account_key",
-        "file_storage_azure_account_key",
-        # File parser credentials
-        "file_parser_iris_token",
-    }
+    _CREDENTIAL_FIELDS = frozenset(
+        {
+            # API Keys
+            "llm_api_key",
+            "retain_llm_api_key",
+            "reflect_llm_api_key",
+            "consolidation_llm_api_key",
+            # Base URLs (could expose infrastructure)
+            "llm_base_url",
+            "retain_llm_base_url",
+            "reflect_llm_base_url",
+            "consolidation_llm_base_url",
+            "embeddings_tei_base_url",
+            "reranker_tei_base_url",
+            "reranker_cohere_base_url",
+            # Service Account Keys
+            "llm_vertexai_service_account_key",
+            # File storage credentials
+            "file_storage_s3_access_key_id",
+            "file_storage_s3_secret_access_key",
+            "file_storage_gcs_service_account_key",
+            "file_storage_azure_account_key",
+            # File parser credentials
+            "file_parser_iris_token",
+        }
+    )
 
     # CONFIGURABLE_FIELDS: Safe behavioral settings that can be customized per-tenant/bank
     # These fields are manually tagged as safe to expose and modify.
     # Excludes credentials, infrastructure config, provider/model selection, and performance tuning.
-    _CONFIGURABLE_FIELDS = {
-        # MCP tool access control
-        "mcp_enabled_tools",
-        # Retention settings (behavioral)
-        "retain_chunk_size",
-        "retain_extraction_mode",
-        "retain_mission",
-        "retain_custom_instructions",
-        # Consolidation settings
-        "enable_observations",
-        "observations_mission",
-        # Reflect settings
-        "reflect_mission",
-        # Disposition settings
-        "disposition_skepticism",
-        "disposition_literalism",
-        "disposition_empathy",
-    }
+    _CONFIGURABLE_FIELDS = frozenset(
+        {
+            # MCP tool access control
+            "mcp_enabled_tools",
+            # Retention settings (behavioral)
+            "retain_chunk_size",
+            "retain_extraction_mode",
+            "retain_mission",
+            "retain_custom_instructions",
+            # Consolidation settings
+            "enable_observations",
+            "observations_mission",
+            # Reflect settings
+            "reflect_mission",
+            # Disposition settings
+            "disposition_skepticism",
+            "disposition_literalism",
+            "disposition_empathy",
+        }
+    )
 
     @property
     def file_conversion_max_batch_size_bytes(self) -> int:
@@ -784,7 +789,7 @@ class HindsightConfig:
         return self.file_conversion_max_batch_size_mb * 1024 * 1024
 
     @classmethod
-    def get_configurable_fields(cls) -> set[str]:
+    def get_configurable_fields(cls) -> frozenset[str]:
         """
         Get set of field names that are configurable per-tenant/bank via API.
 
@@ -793,12 +798,12 @@ class HindsightConfig:
         Excludes credentials, infrastructure config, and provider/model selection.
 
         Returns:
-            Set of configurable field names
+            Frozen set of configurable field names
         """
-        return cls._CONFIGURABLE_FIELDS.copy()
+        return cls._CONFIGURABLE_FIELDS
 
     @classmethod
-    def get_credential_fields(cls) -> set[str]:
+    def get_credential_fields(cls) -> frozenset[str]:
         """
         Get set of field names that are credentials (NEVER exposed via API).
 
@@ -806,12 +811,12 @@ class HindsightConfig:
         These must never be returned in API responses or accepted in updates.
 
         Returns:
-            Set of credential field names
+            Frozen set of credential field names
         """
-        return cls._CREDENTIAL_FIELDS.copy()
+        return cls._CREDENTIAL_FIELDS
 
     @classmethod
-    def get_hierarchical_fields(cls) -> set[str]:
+    def get_hierarchical_fields(cls) -> frozenset[str]:
         """
         DEPRECATED: Use get_configurable_fields() instead.
 
@@ -820,7 +825,8 @@ class HindsightConfig:
         return cls.get_configurable_fields()
 
     @classmethod
-    def get_static_fields(cls) -> set[str]:
+    @cache
+    def get_static_fields(cls) -> frozenset[str]:
         """
         Get set of field names that are static (server-level only).
 
@@ -829,12 +835,10 @@ class HindsightConfig:
         Also includes credential fields which are never configurable.
 
         Returns:
-            Set of static field names
+            Frozen set of static field names (computed once per class)
         """
-        # Get all field names from dataclass
-        all_fields = {f.name for f in fields(cls)}
-        # Static fields = all fields - configurable fields
-        return all_fields - cls._CONFIGURABLE_FIELDS
+        # Static fields = all dataclass fields - configurable fields
+        return frozenset(f.name for f in fields(cls)) - cls._CONFIGURABLE_FIELDS
 
     def validate(self) -> None:
         """Validate configuration values and raise errors for invalid combinations."""
@@ -4,24 +4,31 @@ Configuration resolution with hierarchical overrides.
 Resolves config values through the hierarchy:
   Global (env vars) → Tenant config (via extension) → Bank config (database)
 
-Config values are resolved on every request to ensure consistency across
-multiple API servers.
+Bank overrides are cached in-process for a short TTL and invalidated on every
+write made through this resolver, so other API servers observe changes within
+BANK_CONFIG_CACHE_TTL_SECONDS.
 """
 
-import json
+import asyncio
 import logging
-from dataclasses import asdict
+import time
+from dataclasses import asdict, fields
 from typing import Any
 
 import asyncpg
 
-from hindsight_api.config import HindsightConfig, _get_raw_config, normalize_config_dict
-from hindsight_api.engine.memory_engine import fq_table
+from hindsight_api.config import HindsightConfig, _get_raw_config, normalize_config_dict, normalize_config_key
+from hindsight_api.engine import json_utils
+from hindsight_api.engine.memory_engine import fq_table, get_current_schema
 from hindsight_api.extensions.tenant import TenantExtension
 from hindsight_api.models import RequestContext
 
 logger = logging.getLogger(__name__)
 
+# How long bank config overrides are served from the in-process cache. Writes through
+# this resolver invalidate immediately; peers pick up changes once the entry expires.
+BANK_CONFIG_CACHE_TTL_SECONDS = 5.0
+
 
 class ConfigResolver:
     """Resolves hierarchical configuration with tenant/bank overrides."""
@@ -39,6 +46,37 @@ class ConfigResolver:
         self._global_config = _get_raw_config()
         self._configurable_fields = HindsightConfig.get_configurable_fields()
         self._credential_fields = HindsightConfig.get_credential_fields()
+        self._static_fields = HindsightConfig.get_static_fields()
+        self._configurable_fields_list = sorted(self._configurable_fields)
+        # Common spellings of each configurable field -> canonical name, so overrides can be
+        # normalized and filtered in one pass
+        self._override_key_map = {
+            spelling: field
+            for field in self._configurable_fields
+            for spelling in (field, field.upper(), f"HINDSIGHT_API_{field.upper()}")
+        }
+        # Fields returned by get_bank_config, in dataclass declaration order
+        self._exposed_fields = tuple(
+            f.name
+            for f in fields(HindsightConfig)
+            if f.name in self._configurable_fields and f.name not in self._credential_fields
+        )
+        # (schema, bank_id) -> (fetched_at, overrides)
+        self._bank_config_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        # schema -> {bank_id: future} for lookups waiting to be batched into one query
+        self._pending_bank_loads: dict[str, dict[str, asyncio.Future]] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    @property
+    def _global_config(self) -> HindsightConfig:
+        return self.__global_config
+
+    @_global_config.setter
+    def _global_config(self, config: HindsightConfig) -> None:
+        # Global config is immutable, so serialize it once; per-request resolution
+        # works on a shallow copy since overrides replace whole values.
+        self.__global_config = config
+        self._global_config_dict = asdict(config)
 
     async def resolve_full_config(self, bank_id: str, context: RequestContext | None = None) -> HindsightConfig:
         """
@@ -59,34 +97,64 @@ class ConfigResolver:
         Returns:
             Complete HindsightConfig with hierarchical overrides applied
         """
-        # Start with global config (all fields)
-        config_dict = asdict(self._global_config)
+        config_dict = await self._resolve_config_dict(bank_id, context)
+        return HindsightConfig(**config_dict)
 
-        # Load tenant config overrides (if tenant extension available)
+    async def _resolve_config_dict(self, bank_id: str, context: RequestContext | None) -> dict[str, Any]:
+        """
+        Merge global, tenant and bank config into a plain dict of all fields.
+
+        The result may be the shared global dict when there is nothing to merge,
+        so callers must treat it as read-only.
+        """
         if self.tenant_extension and context:
-            try:
-                tenant_overrides = await self.tenant_extension.get_tenant_config(context)
-                if tenant_overrides:
-                    # Normalize keys and filter to configurable fields only
-                    normalized_tenant = normalize_config_dict(tenant_overrides)
-                    configurable_tenant = {k: v for k, v in normalized_tenant.items() if k in self._configurable_fields}
-                    config_dict.update(configurable_tenant)
-                    logger.debug(
-                        f"Applied tenant config overrides for bank {bank_id}: {list(configurable_tenant.keys())}"
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to load tenant config for bank {bank_id}: {e}")
+            # Tenant and bank overrides are independent, so load them concurrently
+            tenant_overrides, bank_overrides = await asyncio.gather(
+                self._load_tenant_config(bank_id, context),
+                self._load_bank_config(bank_id),
+            )
+        else:
+            tenant_overrides, bank_overrides = {}, await self._load_bank_config(bank_id)
+
+        # Common case: no overrides at any level, nothing to copy
+        if not tenant_overrides and not bank_overrides:
+            return self._global_config_dict
+
+        # Start with global config (all fields)
+        config_dict = self._global_config_dict.copy()
+
+        if tenant_overrides:
+            config_dict.update(tenant_overrides)
+            logger.debug("Applied tenant config overrides for bank %s: %s", bank_id, list(tenant_overrides))
 
-        # Load bank config overrides
-        bank_overrides = await self._load_bank_config(bank_id)
         if bank_overrides:
             config_dict.update(bank_overrides)
-            logger.debug(f"Applied bank config overrides for bank {bank_id}: {list(bank_overrides.keys())}")
+            logger.debug("Applied bank config overrides for bank %s: %s", bank_id, list(bank_overrides))
+
+        return config_dict
+
+    async def _load_tenant_config(self, bank_id: str, context: RequestContext | None) -> dict[str, Any]:
+        """
+        Load tenant config overrides from the tenant extension.
 
-        # Return full config object (dataclass doesn't have __init__ that accepts kwargs, so we update the object)
-        # Create a new config instance by copying the global config and updating fields
-        resolved_config = HindsightConfig(**config_dict)
-        return resolved_config
+        Args:
+            bank_id: Bank identifier (for logging)
+            context: Request context for tenant config resolution
+
+        Returns:
+            Dict of config overrides (only configurable fields, normalized keys)
+        """
+        if not (self.tenant_extension and context):
+            return {}
+
+        try:
+            tenant_overrides = await self.tenant_extension.get_tenant_config(context)
+            if tenant_overrides:
+                return self._filter_overrides(tenant_overrides)
+        except Exception as e:
+            logger.warning(f"Failed to load tenant config for bank {bank_id}: {e}")
+
+        return {}
 
     async def get_bank_config(self, bank_id: str, context: RequestContext | None = None) -> dict[str, Any]:
         """
@@ -97,8 +165,8 @@ class ConfigResolver:
         2. Tenant config overrides (from TenantExtension.get_tenant_config())
         3. Bank config overrides (from banks.config JSONB)
 
-        Note: Config is resolved on every call (not cached) to ensure consistency
-        across multiple API servers.
+        Note: Bank overrides are cached for BANK_CONFIG_CACHE_TTL_SECONDS and invalidated
+        on writes through this resolver; a fresh dict is returned on every call.
 
         SECURITY:
         - Only returns configurable fields (excludes static/infrastructure fields)
@@ -112,15 +180,11 @@ class ConfigResolver:
         Returns:
             Dict of allowed configurable fields only (never includes credentials or static fields)
         """
-        # Resolve full config with all hierarchical overrides
-        resolved_config = await self.resolve_full_config(bank_id, context)
-        config_dict = asdict(resolved_config)
+        # Resolve all hierarchical overrides (no need to round-trip through HindsightConfig)
+        config_dict = await self._resolve_config_dict(bank_id, context)
 
-        # SECURITY: Filter to only configurable fields (exclude static/infrastructure)
-        filtered = {k: v for k, v in config_dict.items() if k in self._configurable_fields}
-
-        # SECURITY: Remove ALL credential fields (API keys, base URLs, etc.)
-        filtered = {k: v for k, v in filtered.items() if k not in self._credential_fields}
+        # SECURITY: Only configurable fields, never credentials (API keys, base URLs, etc.)
+        filtered = {k: config_dict[k] for k in self._exposed_fields}
 
         # PERMISSIONS: Further filter based on tenant/bank permissions
         if self.tenant_extension and context:
@@ -129,17 +193,46 @@ class ConfigResolver:
                 if allowed_fields is not None:  # None means "allow all"
                     filtered = {k: v for k, v in filtered.items() if k in allowed_fields}
                     logger.debug(
-                        f"Applied permission filter for bank {bank_id}: allowed={len(allowed_fields)} fields, "
-                        f"returned={len(filtered)} fields"
+                        "Applied permission filter for bank %s: allowed=%d fields, returned=%d fields",
+                        bank_id,
+                        len(allowed_fields),
+                        len(filtered),
                     )
             except Exception as e:
                 logger.warning(f"Failed to load permissions for bank {bank_id}: {e}")
 
         return filtered
 
+    def invalidate_bank_config(self, bank_id: str) -> None:
+        """
+        Drop the cached overrides for a bank in the current schema.
+
+        Args:
+            bank_id: Bank identifier
+        """
+        self._bank_config_cache.pop((get_current_schema(), bank_id), None)
+
+    def _store_bank_config(self, bank_id: str, overrides: dict[str, Any]) -> None:
+        """Cache freshly written overrides for a bank in the current schema."""
+        self._bank_config_cache[(get_current_schema(), bank_id)] = (time.monotonic(), overrides)
+
+    def _filter_overrides(self, overrides: dict[str, Any]) -> dict[str, Any]:
+        """Normalize override keys and keep only configurable fields."""
+        key_map = self._override_key_map
+        filtered = {}
+        for key, value in overrides.items():
+            field = key_map.get(key)
+            if field is None:
+                # Uncommon spelling (e.g. mixed case): fall back to the general normalizer
+                field = normalize_config_key(key)
+                if field not in self._configurable_fields:
+                    continue
+            filtered[field] = value
+        return filtered
+
     async def _load_bank_config(self, bank_id: str) -> dict[str, Any]:
         """
-        Load bank config overrides from banks.config JSONB column.
+        Load bank config overrides, serving from the in-process cache when fresh.
 
         Args:
             bank_id: Bank identifier
@@ -147,31 +240,118 @@ class ConfigResolver:
         Returns:
             Dict of config overrides (only configurable fields, normalized keys)
         """
-        try:
-            async with self.pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    f"""
-                    SELECT config FROM {fq_table("banks")} WHERE bank_id = $1
-                    """,
-                    bank_id,
-                )
+        cache_key = (get_current_schema(), bank_id)
+        cached = self._bank_config_cache.get(cache_key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < BANK_CONFIG_CACHE_TTL_SECONDS:
+            return dict(cached[1])
 
-                if row and row["config"]:
-                    config_data = row["config"]
+        overrides = await self._fetch_bank_config(bank_id)
+        if overrides is None:
+            return {}
 
-                    # Handle case where JSONB is returned as JSON string
-                    if isinstance(config_data, str):
-                        config_data = json.loads(config_data)
+        self._bank_config_cache[cache_key] = (now, overrides)
+        return dict(overrides)
 
-                    # Normalize keys (handle both env var format and Python field format)
-                    normalized = normalize_config_dict(config_data)
+    async def _fetch_bank_config(self, bank_id: str) -> dict[str, Any] | None:
+        """
+        Fetch bank config overrides from banks.config JSONB column.
 
-                    # Only return overrides for configurable fields
-                    return {k: v for k, v in normalized.items() if k in self._configurable_fields}
-        except Exception as e:
-            logger.error(f"Failed to load bank config for {bank_id}: {e}")
+        Concurrent misses issued in the same event-loop tick are coalesced into a
+        single ``bank_id = ANY($1)`` query per schema, and concurrent misses for the
+        same bank share one lookup.
 
-        return {}
+        Args:
+            bank_id: Bank identifier
+
+        Returns:
+            Dict of config overrides (only configurable fields, normalized keys),
+            or None if the lookup failed and the result should not be cached
+        """
+        loop = asyncio.get_running_loop()
+        schema = get_current_schema()
+
+        pending = self._pending_bank_loads.get(schema)
+        if pending is None:
+            pending = self._pending_bank_loads[schema] = {}
+            loop.call_soon(self._start_bank_config_batch, schema)
+
+        future = pending.get(bank_id)
+        if future is None:
+            future = pending[bank_id] = loop.create_future()
+
+        # Shield so one cancelled caller does not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    def _start_bank_config_batch(self, schema: str) -> None:
+        """Dispatch all bank config lookups queued for a schema during this tick."""
+        pending = self._pending_bank_loads.pop(schema)
+        task = asyncio.create_task(self._fetch_bank_config_batch(pending))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _fetch_bank_config_batch(self, pending: dict[str, asyncio.Future]) -> None:
+        """
+        Load config overrides for a batch of banks and resolve their futures.
+
+        If the batched query fails, each bank is retried on its own so one bad row only
+        costs that bank its overrides. Futures are always resolved, even if this task is
+        cancelled; banks without a result get None so nothing is cached for them.
+
+        Args:
+            pending: Bank identifier -> future awaiting its overrides
+        """
+        results: dict[str, dict[str, Any]] = {}
+        try:
+            try:
+                results = await self._query_bank_configs(list(pending))
+            except Exception as e:
+                if len(pending) == 1:
+                    logger.error(f"Failed to load bank config for {next(iter(pending))}: {e}")
+                else:
+                    logger.warning(f"Batched bank config load failed for {sorted(pending)}, retrying per bank: {e}")
+                    for bank_id in pending:
+                        try:
+                            results.update(await self._query_bank_configs([bank_id]))
+                        except Exception as e:
+                            logger.error(f"Failed to load bank config for {bank_id}: {e}")
+        finally:
+            for bank_id, future in pending.items():
+                if not future.done():
+                    future.set_result(results.get(bank_id))
+
+    async def _query_bank_configs(self, bank_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Query config overrides for the given banks.
+
+        Args:
+            bank_ids: Bank identifiers to look up
+
+        Returns:
+            Bank identifier -> overrides for every requested bank ({} when it has none)
+        """
+        # Normalize keys (env var or Python field format) and keep only configurable
+        # fields in SQL, so only the overrides we apply cross the wire. Banks with no
+        # matching keys, or whose config is not a JSON object, produce no row at all.
+        rows = await self.pool.fetch(
+            f"""
+            SELECT b.bank_id, jsonb_object_agg(k.name, e.value) AS config
+            FROM {fq_table("banks")} b
+            CROSS JOIN LATERAL jsonb_each(b.config) e
+            CROSS JOIN LATERAL (SELECT lower(regexp_replace(e.key, '^HINDSIGHT_API_', '')) AS name) k
+            WHERE b.bank_id = ANY($1::text[])
+              AND jsonb_typeof(b.config) = 'object'
+              AND k.name = ANY($2::text[])
+            GROUP BY b.bank_id
+            """,
+            bank_ids,
+            self._configurable_fields_list,
+        )
+        # asyncpg returns JSONB as text (no type codec is registered on the pool)
+        results = {row["bank_id"]: json_utils.loads(row["config"]) for row in rows}
+        for bank_id in bank_ids:
+            results.setdefault(bank_id, {})
+        return results
 
     async def update_bank_config(
         self, bank_id: str, updates: dict[str, Any], context: RequestContext | None = None
@@ -192,9 +372,12 @@ class ConfigResolver:
         """
         # Normalize keys
         normalized_updates = normalize_config_dict(updates)
+        if not normalized_updates:
+            return
+        update_keys = normalized_updates.keys()
 
         # SECURITY: Reject credential fields explicitly
-        credential_attempts = set(normalized_updates.keys()) & self._credential_fields
+        credential_attempts = update_keys & self._credential_fields
         if credential_attempts:
             raise ValueError(
                 f"Cannot set credential fields via API: {sorted(credential_attempts)}. "
@@ -202,21 +385,20 @@ class ConfigResolver:
             )
 
         # Validate all fields are configurable
-        invalid_fields = set(normalized_updates.keys()) - self._configurable_fields
+        invalid_fields = update_keys - self._configurable_fields
         if invalid_fields:
-            static_fields = HindsightConfig.get_static_fields()
-            invalid_static = invalid_fields & static_fields
+            invalid_static = invalid_fields & self._static_fields
             if invalid_static:
                 raise ValueError(
                     f"Cannot override static (server-level) fields: {sorted(invalid_static)}. "
                     f"Only configurable fields can be overridden per-bank. "
-                    f"Configurable fields include: {sorted(list(self._configurable_fields)[:10])}... "
+                    f"Configurable fields include: {self._configurable_fields_list[:10]}... "
                     f"(total: {len(self._configurable_fields)} fields)"
                 )
             else:
                 raise ValueError(
                     f"Unknown configuration fields: {sorted(invalid_fields)}. "
-                    f"Valid configurable fields: {sorted(list(self._configurable_fields)[:10])}..."
+                    f"Valid configurable fields: {self._configurable_fields_list[:10]}..."
                 )
 
         # PERMISSIONS: Check tenant/bank permissions
@@ -224,7 +406,7 @@ class ConfigResolver:
             try:
                 allowed_fields = await self.tenant_extension.get_allowed_config_fields(context, bank_id)
                 if allowed_fields is not None:  # None means "allow all"
-                    disallowed = set(normalized_updates.keys()) - allowed_fields
+                    disallowed = update_keys - allowed_fields
                     if disallowed:
                         raise ValueError(
                             f"Not allowed to modify fields: {sorted(disallowed)}. "
@@ -240,17 +422,23 @@ class ConfigResolver:
                 # Continue without permission check (fail open for backward compatibility)
 
         # Merge with existing config (JSONB || operator)
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                f"""
-                UPDATE {fq_table("banks")}
-                SET config = config || $1::jsonb,
-                    updated_at = now()
-                WHERE bank_id = $2
-                """,
-                json.dumps(normalized_updates),
-                bank_id,
-            )
+        # RETURNING the merged config lets us prime the cache without a second read
+        merged_config = await self.pool.fetchval(
+            f"""
+            UPDATE {fq_table("banks")}
+            SET config = config || $1::jsonb,
+                updated_at = now()
+            WHERE bank_id = $2
+            RETURNING config
+            """,
+            json_utils.dumps(normalized_updates),
+            bank_id,
+        )
+        if merged_config is None:
+            self.invalidate_bank_config(bank_id)
+        else:
+            # asyncpg returns JSONB as text (no type codec is registered on the pool)
+            self._store_bank_config(bank_id, self._filter_overrides(json_utils.loads(merged_config)))
 
         logger.info(f"Updated bank config for {bank_id}: {list(normalized_updates.keys())}")
 
@@ -261,15 +449,19 @@ class ConfigResolver:
         Args:
             bank_id: Bank identifier
         """
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                f"""
-                UPDATE {fq_table("banks")}
-                SET config = '{{}}'::jsonb,
-                    updated_at = now()
-                WHERE bank_id = $1
-                """,
-                bank_id,
-            )
+        reset_bank_id = await self.pool.fetchval(
+            f"""
+            UPDATE {fq_table("banks")}
+            SET config = '{{}}'::jsonb,
+                updated_at = now()
+            WHERE bank_id = $1
+            RETURNING bank_id
+            """,
+            bank_id,
+        )
+        if reset_bank_id is None:
+            self.invalidate_bank_config(bank_id)
+        else:
+            self._store_bank_config(bank_id, {})
 
         logger.info(f"Reset bank config for {bank_id} to defaults")
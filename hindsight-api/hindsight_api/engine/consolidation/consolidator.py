@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel
 
 from ...config import get_config
+from .. import json_utils
 from ..memory_engine import fq_table
 from ..retain import embedding_utils
 from .prompts import build_batch_consolidation_prompt
@@ -863,7 +864,7 @@ async def _consolidate_batch_with_llm(
     """Single LLM call for a batch of facts against a pooled set of observations."""
     if union_observations:
         obs_list = _build_observations_for_llm(union_observations, union_source_facts)
-        observations_text = json.dumps(obs_list, indent=2)
+        observations_text = json_utils.dumps(obs_list, indent=True)
     else:
         observations_text = "[]"
 
@@ -1,5 +1,7 @@
 """Prompts for the consolidation engine."""
 
+from functools import lru_cache
+
 # Default mission when no bank-specific mission is set
 _DEFAULT_MISSION = "Track every detail: names, numbers, dates, places, and relationships. Prefer specifics over abstractions, never generalise."
 
@@ -49,18 +51,24 @@ Rules:
 - Return {{"creates": [], "updates": [], "deletes": []}} if nothing durable is found."""
 
 
+_PROMPT_PREAMBLE = (
+    "You are a memory consolidation system. Synthesize facts into observations "
+    "and merge with existing observations when appropriate.\n\n"
+)
+
+# Everything after the mission is identical for every bank
+_PROMPT_SUFFIX = _PROCESSING_RULES + _BATCH_DATA_SECTION + _BATCH_OUTPUT_FORMAT
+
+
+@lru_cache(maxsize=64)
 def build_batch_consolidation_prompt(observations_mission: str | None = None) -> str:
     """
     Build the consolidation prompt for batch mode (multiple facts per LLM call).
 
     The mission defines *what* to track (customisable per bank).
     Processing rules and output format are always present regardless of mission.
+    Results are memoized per mission since the prompt is a pure function of it.
     """
     mission = observations_mission or _DEFAULT_MISSION
 
-    return (
-        "You are a memory consolidation system. Synthesize facts into observations "
-        "and merge with existing observations when appropriate.\n\n"
-        f"## MISSION\n{mission}\n\n"
-        f"{_PROCESSING_RULES}" + _BATCH_DATA_SECTION + _BATCH_OUTPUT_FORMAT
-    )
+    return f"{_PROMPT_PREAMBLE}## MISSION\n{mission}\n\n{_PROMPT_SUFFIX}"
@@ -0,0 +1,54 @@
+"""
+JSON serialization helpers backed by orjson.
+
+Output is always ``str`` so callers can pass it straight to asyncpg ``::jsonb``
+parameters or embed it in prompts. orjson is a direct dependency rather than an
+optional speedup, so the emitted bytes (compact separators, raw UTF-8) are the same
+on every deployment and stored configs and prompt prefixes stay stable.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> str:
+    """
+    Serialize ``obj`` to a JSON string.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with two-space indentation
+        sort_keys: Emit object keys in sorted order
+        default: Fallback for objects that are not natively serializable
+
+    Returns:
+        JSON text
+
+    Raises:
+        TypeError: If ``obj`` cannot be serialized (including integers outside the
+            64-bit range and nesting deeper than orjson's recursion limit)
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(obj, default=default, option=option).decode()
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize JSON text.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    return orjson.loads(data)
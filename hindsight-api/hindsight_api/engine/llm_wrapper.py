@@ -60,6 +60,9 @@ class OutputTooLongError(Exception):
     pass
 
 
+_CONTROL_CHARS_PATTERN = re.compile(r"[\x00-\x1f\x7f]")
+
+
 def parse_llm_json(raw: str) -> Any:
     """
     Robustly parse JSON returned by an LLM.
@@ -92,7 +95,7 @@ def parse_llm_json(raw: str) -> Any:
     except json.JSONDecodeError:
         # Some models (e.g. Gemini) embed raw control characters inside JSON
         # string values. Replacing them with a space usually produces valid JSON.
-        cleaned = re.sub(r"[\x00-\x1f\x7f]", " ", text)
+        cleaned = _CONTROL_CHARS_PATTERN.sub(" ", text)
         return json.loads(cleaned)
 
 
@@ -1346,7 +1346,9 @@ class MemoryEngine(MemoryEngineInterface):
             min_size=self._pool_min_size,
             max_size=self._pool_max_size,
             command_timeout=self._db_command_timeout,
-            statement_cache_size=0,  # Disable prepared statement cache
+            # Disable prepared statement cache: named statements break behind pgbouncer in
+            # transaction pooling mode, and table names vary per tenant schema anyway.
+            statement_cache_size=0,
             timeout=self._db_acquire_timeout,  # Connection acquisition timeout (seconds)
         )
 
@@ -3363,6 +3365,9 @@ class MemoryEngine(MemoryEngineInterface):
                 except Exception as e:
                     raise Exception(f"Failed to delete agent data: {str(e)}")
 
+        if result.get("bank_deleted"):
+            self._config_resolver.invalidate_bank_config(bank_id)
+
         if invalidated_obs > 0:
             await self.submit_async_consolidation(bank_id=bank_id, request_context=request_context)
 
@@ -21,6 +21,34 @@ from hindsight_api.metrics import get_metrics_collector
 logger = logging.getLogger(__name__)
 
 
+def _add_cache_breakpoints(call_params: dict[str, Any]) -> None:
+    """
+    Mark the prompt-cache breakpoints for a tool-calling request.
+
+    Tool loops resend the same tools, system prompt and earlier turns every iteration, so
+    three breakpoints are set: the last tool, the system prompt, and the last block of the
+    last message (so the next turn reuses every earlier one). Prefixes below the provider's
+    minimum cacheable length are simply not cached. Marked entries are copies, so the
+    caller's tools and messages are left untouched.
+    """
+    tools = call_params["tools"]
+    if tools:
+        tools[-1] = {**tools[-1], "cache_control": {"type": "ephemeral"}}
+
+    system_prompt = call_params.get("system")
+    if system_prompt:
+        call_params["system"] = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+    messages = call_params["messages"]
+    if messages and messages[-1]["content"]:
+        last_content = messages[-1]["content"]
+        if isinstance(last_content, str):
+            blocks = [{"type": "text", "text": last_content, "cache_control": {"type": "ephemeral"}}]
+        else:
+            blocks = [*last_content[:-1], {**last_content[-1], "cache_control": {"type": "ephemeral"}}]
+        messages[-1] = {**messages[-1], "content": blocks}
+
+
 class AnthropicLLM(LLMInterface):
     """
     LLM provider using Anthropic's Claude models.
@@ -387,6 +415,7 @@ class AnthropicLLM(LLMInterface):
         }
         if system_prompt:
             call_params["system"] = system_prompt
+        _add_cache_breakpoints(call_params)
 
         if temperature is not None:
             call_params["temperature"] = temperature
@@ -37,6 +37,18 @@ logger = logging.getLogger(__name__)
 # Seed applied to every Groq request for deterministic behavior
 DEFAULT_LLM_SEED = 4242
 
+# Reasoning-model thinking blocks stripped from structured responses, applied in order.
+# Supports: <think>, <thinking>, <reasoning>, |startthink|/|endthink|
+_THINKING_TAG_PATTERNS = tuple(
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r"<think>.*?</think>",
+        r"<thinking>.*?</thinking>",
+        r"<reasoning>.*?</reasoning>",
+        r"\|startthink\|.*?\|endthink\|",
+    )
+)
+
 
 class OpenAICompatibleLLM(LLMInterface):
     """
@@ -112,6 +124,8 @@ class OpenAICompatibleLLM(LLMInterface):
             client_kwargs["timeout"] = self.timeout
 
         self._client = AsyncOpenAI(**client_kwargs)
+        # Long-lived client for Ollama's native API, created on first use
+        self._ollama_client: httpx.AsyncClient | None = None
         logger.info(
             f"OpenAI-compatible client initialized: provider={self.provider}, model={self.model}, "
             f"base_url={self.base_url or 'default'}"
@@ -298,10 +312,8 @@ class OpenAICompatibleLLM(LLMInterface):
                     # Supports: <think>, <thinking>, <reasoning>, |startthink|/|endthink|
                     if content:
                         original_len = len(content)
-                        content = re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL)
-                        content = re.sub(r"<thinking>.*?</thinking>", "", content, flags=re.DOTALL)
-                        content = re.sub(r"<reasoning>.*?</reasoning>", "", content, flags=re.DOTALL)
-                        content = re.sub(r"\|startthink\|.*?\|endthink\|", "", content, flags=re.DOTALL)
+                        for pattern in _THINKING_TAG_PATTERNS:
+                            content = pattern.sub("", content)
                         content = content.strip()
                         if len(content) < original_len:
                             logger.debug(f"Stripped {original_len - len(content)} chars of reasoning tokens")
@@ -689,97 +701,100 @@ class OpenAICompatibleLLM(LLMInterface):
 
         last_exception = None
 
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            for attempt in range(max_retries + 1):
-                try:
-                    response = await client.post(native_url, json=payload)
-                    response.raise_for_status()
+        if self._ollama_client is None:
+            self._ollama_client = httpx.AsyncClient(timeout=300.0)
+        client = self._ollama_client
 
-                    result = response.json()
-                    content = result.get("message", {}).get("content", "")
+        for attempt in range(max_retries + 1):
+            try:
+                response = await client.post(native_url, json=payload)
+                response.raise_for_status()
 
-                    # Parse JSON response
-                    try:
-                        json_data = json.loads(content)
-                    except json.JSONDecodeError as json_err:
-                        content_preview = content[:500] if content else "<empty>"
-                        if content and len(content) > 700:
-                            content_preview = f"{content[:500]}...TRUNCATED...{content[-200:]}"
-                        logger.warning(
-                            f"Ollama JSON parse error (attempt {attempt + 1}/{max_retries + 1}): {json_err}\n"
-                            f"  Model: ollama/{self.model}\n"
-                            f"  Content length: {len(content) if content else 0} chars\n"
-                            f"  Content preview: {content_preview!r}"
-                        )
-                        if attempt < max_retries:
-                            backoff = min(initial_backoff * (2**attempt), max_backoff)
-                            await asyncio.sleep(backoff)
-                            last_exception = json_err
-                            continue
-                        else:
-                            raise
-
-                    # Extract token usage from Ollama response
-                    duration = time.time() - start_time
-                    input_tokens = result.get("prompt_eval_count", 0) or 0
-                    output_tokens = result.get("eval_count", 0) or 0
-                    total_tokens = input_tokens + output_tokens
-
-                    # Record LLM metrics
-                    metrics = get_metrics_collector()
-                    metrics.record_llm_call(
-                        provider=self.provider,
-                        model=self.model,
-                        scope=scope,
-                        duration=duration,
-                        input_tokens=input_tokens,
-                        output_tokens=output_tokens,
-                        success=True,
-                    )
+                result = response.json()
+                content = result.get("message", {}).get("content", "")
 
-                    # Validate against Pydantic model or return raw JSON
-                    if skip_validation:
-                        validated_result = json_data
-                    else:
-                        validated_result = response_format.model_validate(json_data)
-
-                    if return_usage:
-                        token_usage = TokenUsage(
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            total_tokens=total_tokens,
-                        )
-                        return validated_result, token_usage
-                    return validated_result
-
-                except httpx.HTTPStatusError as e:
-                    last_exception = e
+                # Parse JSON response
+                try:
+                    json_data = json.loads(content)
+                except json.JSONDecodeError as json_err:
+                    content_preview = content[:500] if content else "<empty>"
+                    if content and len(content) > 700:
+                        content_preview = f"{content[:500]}...TRUNCATED...{content[-200:]}"
+                    logger.warning(
+                        f"Ollama JSON parse error (attempt {attempt + 1}/{max_retries + 1}): {json_err}\n"
+                        f"  Model: ollama/{self.model}\n"
+                        f"  Content length: {len(content) if content else 0} chars\n"
+                        f"  Content preview: {content_preview!r}"
+                    )
                     if attempt < max_retries:
-                        logger.warning(
-                            f"Ollama HTTP error (attempt {attempt + 1}/{max_retries + 1}): {e.response.status_code}"
-                        )
                         backoff = min(initial_backoff * (2**attempt), max_backoff)
                         await asyncio.sleep(backoff)
+                        last_exception = json_err
                         continue
                     else:
-                        logger.error(f"Ollama HTTP error after {max_retries + 1} attempts: {e}")
                         raise
 
-                except httpx.RequestError as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(f"Ollama connection error (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                        backoff = min(initial_backoff * (2**attempt), max_backoff)
-                        await asyncio.sleep(backoff)
-                        continue
-                    else:
-                        logger.error(f"Ollama connection error after {max_retries + 1} attempts: {e}")
-                        raise
+                # Extract token usage from Ollama response
+                duration = time.time() - start_time
+                input_tokens = result.get("prompt_eval_count", 0) or 0
+                output_tokens = result.get("eval_count", 0) or 0
+                total_tokens = input_tokens + output_tokens
 
-                except Exception as e:
-                    logger.error(f"Unexpected error during Ollama call: {type(e).__name__}: {e}")
+                # Record LLM metrics
+                metrics = get_metrics_collector()
+                metrics.record_llm_call(
+                    provider=self.provider,
+                    model=self.model,
+                    scope=scope,
+                    duration=duration,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    success=True,
+                )
+
+                # Validate against Pydantic model or return raw JSON
+                if skip_validation:
+                    validated_result = json_data
+                else:
+                    validated_result = response_format.model_validate(json_data)
+
+                if return_usage:
+                    token_usage = TokenUsage(
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        total_tokens=total_tokens,
+                    )
+                    return validated_result, token_usage
+                return validated_result
+
+            except httpx.HTTPStatusError as e:
+                last_exception = e
+                if attempt < max_retries:
+                    logger.warning(
+                        f"Ollama HTTP error (attempt {attempt + 1}/{max_retries + 1}): {e.response.status_code}"
+                    )
+                    backoff = min(initial_backoff * (2**attempt), max_backoff)
+                    await asyncio.sleep(backoff)
+                    continue
+                else:
+                    logger.error(f"Ollama HTTP error after {max_retries + 1} attempts: {e}")
+                    raise
+
+            except httpx.RequestError as e:
+                last_exception = e
+                if attempt < max_retries:
+                    logger.warning(f"Ollama connection error (attempt {attempt + 1}/{max_retries + 1}): {e}")
+                    backoff = min(initial_backoff * (2**attempt), max_backoff)
+                    await asyncio.sleep(backoff)
+                    continue
+                else:
+                    logger.error(f"Ollama connection error after {max_retries + 1} attempts: {e}")
                     raise
 
+            except Exception as e:
+                logger.error(f"Unexpected error during Ollama call: {type(e).__name__}: {e}")
+                raise
+
         if last_exception:
             raise last_exception
         raise RuntimeError("Ollama call failed after all retries")
@@ -922,3 +937,6 @@ class OpenAICompatibleLLM(LLMInterface):
         """Clean up resources (close OpenAI client connections)."""
         if hasattr(self, "_client") and self._client:
             await self._client.close()
+        if getattr(self, "_ollama_client", None) is not None:
+            await self._ollama_client.aclose()
+            self._ollama_client = None
@@ -12,8 +12,10 @@ import json
 import logging
 import re
 import time
+import uuid
 from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
+from .. import json_utils
 from .models import DirectiveInfo, LLMCall, ReflectAgentResult, TokenUsageSummary, ToolCall
 from .prompts import FINAL_SYSTEM_PROMPT, _extract_directive_rules, build_final_prompt, build_system_prompt_for_tools
 from .tools_schema import get_reflect_tools
@@ -43,6 +45,118 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_ITERATIONS = 10
 
 
+class _ToolResultCache:
+    """Per-run memoization of retrieval tool callbacks.
+
+    The LLM frequently repeats an identical tool call (same query, same limits) across
+    iterations or even within one parallel batch. The callbacks are read-only, so within
+    a single reflect run the same arguments always yield the same result. In-flight calls
+    are shared, and failed calls are evicted so a retry hits the backend again.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple, asyncio.Future] = {}
+        self.hits = 0
+
+    def wrap(
+        self, tool_name: str, fn: Callable[..., Awaitable[dict[str, Any]]]
+    ) -> Callable[..., Awaitable[dict[str, Any]]]:
+        async def cached(*args: Any) -> dict[str, Any]:
+            key = (tool_name, *(tuple(a) if isinstance(a, list) else a for a in args))
+            future = self._entries.get(key)
+            if future is None:
+                future = asyncio.ensure_future(fn(*args))
+                self._entries[key] = future
+                future.add_done_callback(lambda f: self._evict_failed(key, f))
+            else:
+                self.hits += 1
+            return await asyncio.shield(future)
+
+        return cached
+
+    def _evict_failed(self, key: tuple, future: asyncio.Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            self._entries.pop(key, None)
+
+    def close(self) -> None:
+        """Cancel backend calls still in flight, e.g. when the reflect run is cancelled."""
+        for future in self._entries.values():
+            future.cancel()
+
+
+class _ExpandCoalescer:
+    """Merge expand calls issued in the same event-loop tick into one backend call.
+
+    When the LLM emits several expand() calls in a single turn they run concurrently.
+    Instead of each one fetching memories/chunks/documents separately, calls with the
+    same depth are queued until the next loop iteration, sent as one expand_fn call
+    over the union of IDs, and the results are split back out per caller.
+    """
+
+    def __init__(self, expand_fn: Callable[[list[str], str], Awaitable[dict[str, Any]]]) -> None:
+        self._expand_fn = expand_fn
+        self._pending: dict[str, list[tuple[list[str], asyncio.Future]]] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    async def __call__(self, memory_ids: list[str], depth: str) -> dict[str, Any]:
+        if not _has_valid_memory_id(memory_ids):
+            # expand_fn answers these with a call-level error that a split-back batch result
+            # would turn into an empty success, so they never join a batch
+            return await self._expand_fn(memory_ids, depth)
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(depth)
+        if pending is None:
+            pending = self._pending[depth] = []
+            loop.call_soon(self._start_batch, depth)
+        future = loop.create_future()
+        pending.append((memory_ids, future))
+        return await future
+
+    def close(self) -> None:
+        """Cancel expand batches still in flight."""
+        for task in self._batch_tasks:
+            task.cancel()
+
+    def _start_batch(self, depth: str) -> None:
+        task = asyncio.create_task(self._run_batch(depth, self._pending.pop(depth)))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, depth: str, batch: list[tuple[list[str], asyncio.Future]]) -> None:
+        all_ids = list(dict.fromkeys(mid for memory_ids, _ in batch for mid in memory_ids))
+        try:
+            output = await self._expand_fn(all_ids, depth)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(batch) == 1 or "results" not in output:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(output)
+            return
+
+        by_id = {item["memory_id"]: item for item in output["results"]}
+        for memory_ids, future in batch:
+            if not future.done():
+                results = [by_id[mid] for mid in dict.fromkeys(memory_ids) if mid in by_id]
+                future.set_result({"results": results, "count": len(results)})
+
+
+def _has_valid_memory_id(memory_ids: list[str]) -> bool:
+    """Return True if at least one ID is a well-formed memory UUID."""
+    for mid in memory_ids:
+        try:
+            uuid.UUID(mid)
+        except (ValueError, TypeError, AttributeError):
+            continue
+        return True
+    return False
+
+
 def _normalize_tool_name(name: str) -> str:
     """Normalize tool name from various LLM output formats.
 
@@ -303,212 +417,110 @@ async def run_reflect_agent(
         ReflectAgentResult with final answer and metadata
     """
     reflect_id = f"{bank_id[:8]}-{int(time.time() * 1000) % 100000}"
-    start_time = time.time()
-
-    # Build directives_applied for the trace
-    directives_applied = _build_directives_applied(directives)
-
-    # Extract directive rules for tool schema (if any)
-    directive_rules = _extract_directive_rules(directives) if directives else None
-
-    # Get tools for this agent (with directive compliance field if directives exist)
-    tools = get_reflect_tools(directive_rules=directive_rules)
-
-    # Build initial messages (directives are injected into system prompt at START and END)
-    system_prompt = build_system_prompt_for_tools(
-        bank_profile, context, directives=directives, has_mental_models=has_mental_models, budget=budget
-    )
-    messages: list[dict[str, Any]] = [
-        {"role": "system", "content": system_prompt},
-        {"role": "user", "content": query},
-    ]
-
-    # Tracking
-    total_tools_called = 0
-    tool_trace: list[ToolCall] = []
-    tool_trace_summary: list[dict[str, Any]] = []
-    llm_trace: list[dict[str, Any]] = []
-    context_history: list[dict[str, Any]] = []  # For final prompt fallback
-
-    # Token usage tracking - accumulate across all LLM calls
-    total_input_tokens = 0
-    total_output_tokens = 0
-
-    # Track available IDs for validation (prevents hallucinated citations)
-    available_memory_ids: set[str] = set()
-    available_mental_model_ids: set[str] = set()
-    available_observation_ids: set[str] = set()
-
-    def _get_llm_trace() -> list[LLMCall]:
-        return [
-            LLMCall(
-                scope=c["scope"],
-                duration_ms=c["duration_ms"],
-                input_tokens=c.get("input_tokens", 0),
-                output_tokens=c.get("output_tokens", 0),
-            )
-            for c in llm_trace
-        ]
+    start_time = time.perf_counter_ns()
 
-    def _get_usage() -> TokenUsageSummary:
-        return TokenUsageSummary(
-            input_tokens=total_input_tokens,
-            output_tokens=total_output_tokens,
-            total_tokens=total_input_tokens + total_output_tokens,
-        )
+    # Deduplicate repeated tool calls within this run
+    tool_cache = _ToolResultCache()
+    search_mental_models_fn = tool_cache.wrap("search_mental_models", search_mental_models_fn)
+    search_observations_fn = tool_cache.wrap("search_observations", search_observations_fn)
+    recall_fn = tool_cache.wrap("recall", recall_fn)
+    expand_coalescer = _ExpandCoalescer(expand_fn)
+    expand_fn = tool_cache.wrap("expand", expand_coalescer)
 
-    def _log_completion(answer: str, iterations: int, forced: bool = False):
-        elapsed_ms = int((time.time() - start_time) * 1000)
-        tools_summary = (
-            ", ".join(
-                f"{t['tool']}({t['input_summary']})={t['duration_ms']}ms/{t.get('output_chars', 0)}c"
-                for t in tool_trace_summary
-            )
-            or "none"
-        )
-        llm_summary = ", ".join(f"{c['scope']}={c['duration_ms']}ms" for c in llm_trace) or "none"
-        total_llm_ms = sum(c["duration_ms"] for c in llm_trace)
-        total_tools_ms = sum(t["duration_ms"] for t in tool_trace_summary)
-
-        answer_preview = answer[:100] + "..." if len(answer) > 100 else answer
-        mode = "forced" if forced else "done"
-        logger.info(
-            f"[REFLECT {reflect_id}] {mode} | "
-            f"query='{query[:50]}...' | "
-            f"iterations={iterations} | "
-            f"llm=[{llm_summary}] ({total_llm_ms}ms) | "
-            f"tools=[{tools_summary}] ({total_tools_ms}ms) | "
-            f"answer='{answer_preview}' | "
-            f"total={elapsed_ms}ms"
+    try:
+        # Build directives_applied for the trace
+        directives_applied = _build_directives_applied(directives)
+
+        # Extract directive rules for tool schema (if any)
+        directive_rules = _extract_directive_rules(directives) if directives else None
+
+        # Get tools for this agent (with directive compliance field if directives exist)
+        tools = get_reflect_tools(directive_rules=directive_rules)
+
+        # Build initial messages (directives are injected into system prompt at START and END)
+        system_prompt = build_system_prompt_for_tools(
+            bank_profile,
+            context,
+            directives=directives,
+            has_mental_models=has_mental_models,
+            budget=budget,
+            directive_rules=directive_rules or [],
         )
+        messages: list[dict[str, Any]] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": query},
+        ]
 
-    consecutive_errors = 0
-    for iteration in range(max_iterations):
-        is_last = iteration == max_iterations - 1
-
-        if is_last:
-            # Force text response on last iteration - no tools
-            prompt = build_final_prompt(query, context_history, bank_profile, context)
-            llm_start = time.time()
-            response, usage = await llm_config.call(
-                messages=[
-                    {"role": "system", "content": FINAL_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                scope="reflect",
-                max_completion_tokens=max_tokens,
-                return_usage=True,
-            )
-            llm_duration = int((time.time() - llm_start) * 1000)
-            total_input_tokens += usage.input_tokens
-            total_output_tokens += usage.output_tokens
-            llm_trace.append(
-                {
-                    "scope": "final",
-                    "duration_ms": llm_duration,
-                    "input_tokens": usage.input_tokens,
-                    "output_tokens": usage.output_tokens,
-                }
-            )
-            answer = _clean_answer_text(response.strip())
-
-            # Generate structured output if schema provided
-            structured_output = None
-            if response_schema and answer:
-                structured_output, struct_in, struct_out = await _generate_structured_output(
-                    answer, response_schema, llm_config, reflect_id
+        # Tracking
+        total_tools_called = 0
+        tool_trace: list[ToolCall] = []
+        tool_trace_summary: list[dict[str, Any]] = []
+        llm_trace: list[dict[str, Any]] = []
+        context_history: list[dict[str, Any]] = []  # For final prompt fallback
+        context_history_keys: set[tuple[str, str]] = set()
+
+        # Token usage tracking - accumulate across all LLM calls
+        total_input_tokens = 0
+        total_output_tokens = 0
+
+        # Track available IDs for validation (prevents hallucinated citations)
+        available_memory_ids: set[str] = set()
+        available_mental_model_ids: set[str] = set()
+        available_observation_ids: set[str] = set()
+        evidence_count = 0  # Total IDs across the three sets above
+
+        def _get_llm_trace() -> list[LLMCall]:
+            return [
+                LLMCall(
+                    scope=c["scope"],
+                    duration_ms=c["duration_ms"],
+                    input_tokens=c.get("input_tokens", 0),
+                    output_tokens=c.get("output_tokens", 0),
                 )
-                total_input_tokens += struct_in
-                total_output_tokens += struct_out
+                for c in llm_trace
+            ]
 
-            _log_completion(answer, iteration + 1, forced=True)
-            return ReflectAgentResult(
-                text=answer,
-                structured_output=structured_output,
-                iterations=iteration + 1,
-                tools_called=total_tools_called,
-                tool_trace=tool_trace,
-                llm_trace=_get_llm_trace(),
-                usage=_get_usage(),
-                directives_applied=directives_applied,
+        def _get_usage() -> TokenUsageSummary:
+            return TokenUsageSummary(
+                input_tokens=total_input_tokens,
+                output_tokens=total_output_tokens,
+                total_tokens=total_input_tokens + total_output_tokens,
             )
 
-        # Call LLM with tools
-        llm_start = time.time()
-
-        # Determine tool_choice for this iteration.
-        # Force the full hierarchical retrieval path before allowing auto:
-        # With mental models:
-        #   0 → search_mental_models, 1 → search_observations, 2 → recall, 3+ → auto
-        # Without mental models:
-        #   0 → search_observations, 1 → recall, 2+ → auto
-        if iteration == 0 and has_mental_models:
-            iter_tool_choice: str | dict = {"type": "function", "function": {"name": "search_mental_models"}}
-        elif iteration == 0:
-            iter_tool_choice = {"type": "function", "function": {"name": "search_observations"}}
-        elif iteration == 1 and has_mental_models:
-            iter_tool_choice = {"type": "function", "function": {"name": "search_observations"}}
-        elif iteration == 1 or (iteration == 2 and has_mental_models):
-            iter_tool_choice = {"type": "function", "function": {"name": "recall"}}
-        else:
-            iter_tool_choice = "auto"
-
-        try:
-            result = await llm_config.call_with_tools(
-                messages=messages,
-                tools=tools,
-                scope="reflect_tool_call",
-                tool_choice=iter_tool_choice,
-            )
-            llm_duration = int((time.time() - llm_start) * 1000)
-            consecutive_errors = 0
-            total_input_tokens += result.input_tokens
-            total_output_tokens += result.output_tokens
-            llm_trace.append(
-                {
-                    "scope": f"agent_{iteration + 1}",
-                    "duration_ms": llm_duration,
-                    "input_tokens": result.input_tokens,
-                    "output_tokens": result.output_tokens,
-                }
+        def _log_completion(answer: str, iterations: int, forced: bool = False):
+            if not logger.isEnabledFor(logging.INFO):
+                return
+            elapsed_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+
+            tool_parts = []
+            total_tools_ms = 0
+            for t in tool_trace_summary:
+                tool_parts.append(f"{t['tool']}({t['input_summary']})={t['duration_ms']}ms/{t.get('output_chars', 0)}c")
+                total_tools_ms += t["duration_ms"]
+            llm_parts = []
+            total_llm_ms = 0
+            for c in llm_trace:
+                llm_parts.append(f"{c['scope']}={c['duration_ms']}ms")
+                total_llm_ms += c["duration_ms"]
+            tools_summary = ", ".join(tool_parts) or "none"
+            llm_summary = ", ".join(llm_parts) or "none"
+
+            answer_preview = answer[:100] + "..." if len(answer) > 100 else answer
+            mode = "forced" if forced else "done"
+            logger.info(
+                f"[REFLECT {reflect_id}] {mode} | "
+                f"query='{query[:50]}...' | "
+                f"iterations={iterations} | "
+                f"llm=[{llm_summary}] ({total_llm_ms}ms) | "
+                f"tools=[{tools_summary}] ({total_tools_ms}ms, {tool_cache.hits} cached) | "
+                f"answer='{answer_preview}' | "
+                f"total={elapsed_ms}ms"
             )
 
-        except Exception as e:
-            err_duration = int((time.time() - llm_start) * 1000)
-            consecutive_errors += 1
-            logger.warning(f"[REFLECT {reflect_id}] LLM error on iteration {iteration + 1}: {e} ({err_duration}ms)")
-            llm_trace.append({"scope": f"agent_{iteration + 1}_err", "duration_ms": err_duration})
-            # Guardrail: If no evidence gathered yet, retry (but cap consecutive errors to avoid long hangs)
-            has_gathered_evidence = (
-                bool(available_memory_ids) or bool(available_mental_model_ids) or bool(available_observation_ids)
-            )
-            if not has_gathered_evidence and iteration < max_iterations - 1 and consecutive_errors < 2:
-                continue
-            prompt = build_final_prompt(query, context_history, bank_profile, context)
-            llm_start = time.time()
-            response, usage = await llm_config.call(
-                messages=[
-                    {"role": "system", "content": FINAL_SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                scope="reflect",
-                max_completion_tokens=max_tokens,
-                return_usage=True,
-            )
-            llm_duration = int((time.time() - llm_start) * 1000)
-            total_input_tokens += usage.input_tokens
-            total_output_tokens += usage.output_tokens
-            llm_trace.append(
-                {
-                    "scope": "final",
-                    "duration_ms": llm_duration,
-                    "input_tokens": usage.input_tokens,
-                    "output_tokens": usage.output_tokens,
-                }
-            )
-            answer = _clean_answer_text(response.strip())
+        async def _finalize(answer: str, iterations: int, forced: bool = False) -> ReflectAgentResult:
+            """Build the result for a plain-text answer, adding structured output if requested."""
+            nonlocal total_input_tokens, total_output_tokens
 
-            # Generate structured output if schema provided
             structured_output = None
             if response_schema and answer:
                 structured_output, struct_in, struct_out = await _generate_structured_output(
@@ -517,11 +529,11 @@ async def run_reflect_agent(
                 total_input_tokens += struct_in
                 total_output_tokens += struct_out
 
-            _log_completion(answer, iteration + 1, forced=True)
+            _log_completion(answer, iterations, forced=forced)
             return ReflectAgentResult(
                 text=answer,
                 structured_output=structured_output,
-                iterations=iteration + 1,
+                iterations=iterations,
                 tools_called=total_tools_called,
                 tool_trace=tool_trace,
                 llm_trace=_get_llm_trace(),
@@ -529,34 +541,12 @@ async def run_reflect_agent(
                 directives_applied=directives_applied,
             )
 
-        # No tool calls - LLM wants to respond with text
-        if not result.tool_calls:
-            if result.content:
-                answer = _clean_answer_text(result.content.strip())
+        async def _force_final_answer(iterations: int) -> ReflectAgentResult:
+            """Answer from the data gathered so far with a single tools-free LLM call."""
+            nonlocal total_input_tokens, total_output_tokens
 
-                # Generate structured output if schema provided
-                structured_output = None
-                if response_schema and answer:
-                    structured_output, struct_in, struct_out = await _generate_structured_output(
-                        answer, response_schema, llm_config, reflect_id
-                    )
-                    total_input_tokens += struct_in
-                    total_output_tokens += struct_out
-
-                _log_completion(answer, iteration + 1)
-                return ReflectAgentResult(
-                    text=answer,
-                    structured_output=structured_output,
-                    iterations=iteration + 1,
-                    tools_called=total_tools_called,
-                    tool_trace=tool_trace,
-                    llm_trace=_get_llm_trace(),
-                    usage=_get_usage(),
-                    directives_applied=directives_applied,
-                )
-            # Empty response, force final
             prompt = build_final_prompt(query, context_history, bank_profile, context)
-            llm_start = time.time()
+            llm_start = time.perf_counter_ns()
             response, usage = await llm_config.call(
                 messages=[
                     {"role": "system", "content": FINAL_SYSTEM_PROMPT},
@@ -566,7 +556,7 @@ async def run_reflect_agent(
                 max_completion_tokens=max_tokens,
                 return_usage=True,
             )
-            llm_duration = int((time.time() - llm_start) * 1000)
+            llm_duration = (time.perf_counter_ns() - llm_start) // 1_000_000
             total_input_tokens += usage.input_tokens
             total_output_tokens += usage.output_tokens
             llm_trace.append(
@@ -577,208 +567,245 @@ async def run_reflect_agent(
                     "output_tokens": usage.output_tokens,
                 }
             )
-            answer = _clean_answer_text(response.strip())
-
-            # Generate structured output if schema provided
-            structured_output = None
-            if response_schema and answer:
-                structured_output, struct_in, struct_out = await _generate_structured_output(
-                    answer, response_schema, llm_config, reflect_id
-                )
-                total_input_tokens += struct_in
-                total_output_tokens += struct_out
-
-            _log_completion(answer, iteration + 1, forced=True)
-            return ReflectAgentResult(
-                text=answer,
-                structured_output=structured_output,
-                iterations=iteration + 1,
-                tools_called=total_tools_called,
-                tool_trace=tool_trace,
-                llm_trace=_get_llm_trace(),
-                usage=_get_usage(),
-                directives_applied=directives_applied,
-            )
-
-        # Check for done tool call (handle various LLM output formats)
-        done_call = next((tc for tc in result.tool_calls if _is_done_tool(tc.name)), None)
-        if done_call:
-            # Guardrail: Require evidence before done
-            has_gathered_evidence = (
-                bool(available_memory_ids) or bool(available_mental_model_ids) or bool(available_observation_ids)
-            )
-            if not has_gathered_evidence and iteration < max_iterations - 1:
-                # Add assistant message and fake tool result asking for evidence
-                messages.append(
-                    {
-                        "role": "assistant",
-                        "tool_calls": [_tool_call_to_dict(done_call)],
-                    }
+            return await _finalize(_clean_answer_text(response.strip()), iterations, forced=True)
+
+        consecutive_errors = 0
+        for iteration in range(max_iterations):
+            is_last = iteration == max_iterations - 1
+
+            if is_last:
+                # Force text response on last iteration - no tools
+                return await _force_final_answer(iteration + 1)
+
+            # Call LLM with tools
+            llm_start = time.perf_counter_ns()
+
+            # Determine tool_choice for this iteration.
+            # Force the full hierarchical retrieval path before allowing auto:
+            # With mental models:
+            #   0 → search_mental_models, 1 → search_observations, 2 → recall, 3+ → auto
+            # Without mental models:
+            #   0 → search_observations, 1 → recall, 2+ → auto
+            if iteration == 0 and has_mental_models:
+                iter_tool_choice: str | dict = {"type": "function", "function": {"name": "search_mental_models"}}
+            elif iteration == 0:
+                iter_tool_choice = {"type": "function", "function": {"name": "search_observations"}}
+            elif iteration == 1 and has_mental_models:
+                iter_tool_choice = {"type": "function", "function": {"name": "search_observations"}}
+            elif iteration == 1 or (iteration == 2 and has_mental_models):
+                iter_tool_choice = {"type": "function", "function": {"name": "recall"}}
+            else:
+                iter_tool_choice = "auto"
+
+            try:
+                result = await llm_config.call_with_tools(
+                    messages=messages,
+                    tools=tools,
+                    scope="reflect_tool_call",
+                    tool_choice=iter_tool_choice,
                 )
-                messages.append(
+                llm_duration = (time.perf_counter_ns() - llm_start) // 1_000_000
+                consecutive_errors = 0
+                total_input_tokens += result.input_tokens
+                total_output_tokens += result.output_tokens
+                llm_trace.append(
                     {
-                        "role": "tool",
-                        "tool_call_id": done_call.id,
-                        "name": done_call.name,  # Required by Gemini
-                        "content": json.dumps(
-                            {
-                                "error": "You must search for information first. Use search_mental_models(), search_observations(), or recall() before providing your final answer."
-                            }
-                        ),
+                        "scope": f"agent_{iteration + 1}",
+                        "duration_ms": llm_duration,
+                        "input_tokens": result.input_tokens,
+                        "output_tokens": result.output_tokens,
                     }
                 )
-                continue
-
-            # Process done tool - wrap with tool call span
-            from hindsight_api.tracing import get_tracer
-
-            tracer = get_tracer()
-            span_name = "hindsight.reflect_tool_call"
-            with tracer.start_as_current_span(span_name) as span:
-                span.set_attribute("hindsight.scope", "reflect_tool_call")
-                span.set_attribute("hindsight.operation", "reflect_tool_call")
-                return await _process_done_tool(
-                    done_call,
-                    available_memory_ids,
-                    available_mental_model_ids,
-                    available_observation_ids,
-                    iteration + 1,
-                    total_tools_called,
-                    tool_trace,
-                    _get_llm_trace(),
-                    _get_usage(),
-                    _log_completion,
-                    reflect_id,
-                    directives_applied=directives_applied,
-                    llm_config=llm_config,
-                    response_schema=response_schema,
-                )
 
-        # Execute other tools in parallel (exclude done tool in all its format variants)
-        other_tools = [tc for tc in result.tool_calls if not _is_done_tool(tc.name)]
-        if other_tools:
-            # Add assistant message with tool calls
-            messages.append(
-                {
-                    "role": "assistant",
-                    "tool_calls": [_tool_call_to_dict(tc) for tc in other_tools],
-                }
-            )
-
-            # Execute tools in parallel
-            tool_tasks = [
-                _execute_tool_with_timing(
-                    tc,
-                    search_mental_models_fn,
-                    search_observations_fn,
-                    recall_fn,
-                    expand_fn,
-                )
-                for tc in other_tools
-            ]
-            tool_results = await asyncio.gather(*tool_tasks, return_exceptions=True)
-            total_tools_called += len(other_tools)
-
-            # Process results and add to messages
-            for tc, result_data in zip(other_tools, tool_results):
-                if isinstance(result_data, Exception):
-                    # Tool execution failed - send error back to LLM so it can try again
-                    logger.warning(f"[REFLECT {reflect_id}] Tool {tc.name} failed with exception: {result_data}")
-                    output = {"error": f"Tool execution failed: {result_data}"}
-                    duration_ms = 0
-                else:
-                    output, duration_ms = result_data
-
-                # Normalize tool name for consistent tracking
-                normalized_tool_name = _normalize_tool_name(tc.name)
-
-                # Check if tool returned an error response - log but continue (LLM will see the error)
-                if isinstance(output, dict) and "error" in output:
-                    logger.warning(
-                        f"[REFLECT {reflect_id}] Tool {normalized_tool_name} returned error: {output['error']}"
+            except Exception as e:
+                err_duration = (time.perf_counter_ns() - llm_start) // 1_000_000
+                consecutive_errors += 1
+                logger.warning(f"[REFLECT {reflect_id}] LLM error on iteration {iteration + 1}: {e} ({err_duration}ms)")
+                llm_trace.append({"scope": f"agent_{iteration + 1}_err", "duration_ms": err_duration})
+                # Guardrail: If no evidence gathered yet, retry (but cap consecutive errors to avoid long hangs)
+                if evidence_count == 0 and iteration < max_iterations - 1 and consecutive_errors < 2:
+                    continue
+                return await _force_final_answer(iteration + 1)
+
+            # No tool calls - LLM wants to respond with text
+            if not result.tool_calls:
+                if result.content:
+                    answer = _clean_answer_text(result.content.strip())
+                    return await _finalize(answer, iteration + 1)
+                # Empty response, force final
+                return await _force_final_answer(iteration + 1)
+
+            # Check for done tool call (handle various LLM output formats)
+            done_call = next((tc for tc in result.tool_calls if _is_done_tool(tc.name)), None)
+            if done_call:
+                # Guardrail: Require evidence before done
+                if evidence_count == 0 and iteration < max_iterations - 1:
+                    # Add assistant message and fake tool result asking for evidence
+                    messages.append(
+                        {
+                            "role": "assistant",
+                            "tool_calls": [_tool_call_to_dict(done_call)],
+                        }
+                    )
+                    messages.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": done_call.id,
+                            "name": done_call.name,  # Required by Gemini
+                            "content": json.dumps(
+                                {
+                                    "error": "You must search for information first. Use search_mental_models(), search_observations(), or recall() before providing your final answer."
+                                }
+                            ),
+                        }
+                    )
+                    continue
+
+                # Process done tool - wrap with tool call span
+                from hindsight_api.tracing import get_tracer
+
+                tracer = get_tracer()
+                span_name = "hindsight.reflect_tool_call"
+                with tracer.start_as_current_span(span_name) as span:
+                    span.set_attribute("hindsight.scope", "reflect_tool_call")
+                    span.set_attribute("hindsight.operation", "reflect_tool_call")
+                    return await _process_done_tool(
+                        done_call,
+                        available_memory_ids,
+                        available_mental_model_ids,
+                        available_observation_ids,
+                        iteration + 1,
+                        total_tools_called,
+                        tool_trace,
+                        _get_llm_trace(),
+                        _get_usage(),
+                        _log_completion,
+                        reflect_id,
+                        directives_applied=directives_applied,
+                        llm_config=llm_config,
+                        response_schema=response_schema,
                     )
 
-                # Track available IDs from tool results (only for successful responses)
-                if (
-                    normalized_tool_name == "search_mental_models"
-                    and isinstance(output, dict)
-                    and "mental_models" in output
-                ):
-                    for mm in output["mental_models"]:
-                        if "id" in mm:
-                            available_mental_model_ids.add(mm["id"])
-
-                if (
-                    normalized_tool_name == "search_observations"
-                    and isinstance(output, dict)
-                    and "observations" in output
-                ):
-                    for obs in output["observations"]:
-                        if "id" in obs:
-                            available_observation_ids.add(obs["id"])
-
-                if normalized_tool_name == "recall" and isinstance(output, dict) and "memories" in output:
-                    for memory in output["memories"]:
-                        if "id" in memory:
-                            available_memory_ids.add(memory["id"])
-
-                # Add tool result message
-                messages.append(
+            # Execute other tools in parallel (exclude done tool in all its format variants)
+            other_tools = [tc for tc in result.tool_calls if not _is_done_tool(tc.name)]
+            if other_tools:
+                # Build this turn's messages locally (assistant tool calls + one result per call)
+                # and add them to the conversation in one step once every tool has finished
+                turn_messages: list[dict[str, Any]] = [
                     {
-                        "role": "tool",
-                        "tool_call_id": tc.id,
-                        "name": tc.name,  # Required by Gemini
-                        "content": json.dumps(output, default=str),
+                        "role": "assistant",
+                        "tool_calls": [_tool_call_to_dict(tc) for tc in other_tools],
                     }
-                )
-
-                # Track for logging and context history
-                input_dict = {"tool": tc.name, **tc.arguments}
-                input_summary = _summarize_input(tc.name, tc.arguments)
-
-                # Extract reason from tool arguments (if provided)
-                tool_reason = tc.arguments.get("reason")
-
-                tool_trace.append(
-                    ToolCall(
-                        tool=tc.name,
-                        reason=tool_reason,
-                        input=input_dict,
-                        output=output,
-                        duration_ms=duration_ms,
-                        iteration=iteration + 1,
+                ]
+                turn_trace: list[ToolCall] = []
+                turn_trace_summary: list[dict[str, Any]] = []
+
+                # Execute tools in parallel. Each task also serializes its own output, so that
+                # work overlaps with tools that are still running.
+                async with asyncio.TaskGroup() as tg:
+                    tool_tasks = [
+                        tg.create_task(
+                            _run_tool_call(
+                                tc,
+                                reflect_id,
+                                search_mental_models_fn,
+                                search_observations_fn,
+                                recall_fn,
+                                expand_fn,
+                            )
+                        )
+                        for tc in other_tools
+                    ]
+                total_tools_called += len(other_tools)
+
+                # Process results in call order and add to messages
+                for tc, task in zip(other_tools, tool_tasks):
+                    output, duration_ms, serialized_output = task.result()
+
+                    # Normalize tool name for consistent tracking
+                    normalized_tool_name = _normalize_tool_name(tc.name)
+
+                    # Check if tool returned an error response - log but continue (LLM will see the error)
+                    if isinstance(output, dict) and "error" in output:
+                        logger.warning(
+                            f"[REFLECT {reflect_id}] Tool {normalized_tool_name} returned error: {output['error']}"
+                        )
+
+                    # Track available IDs from tool results (only for successful responses)
+                    evidence_count += _track_result_ids(
+                        normalized_tool_name,
+                        output,
+                        available_memory_ids,
+                        available_mental_model_ids,
+                        available_observation_ids,
                     )
-                )
 
-                try:
-                    output_chars = len(json.dumps(output))
-                except (TypeError, ValueError):
-                    output_chars = len(str(output))
+                    # Add tool result message (serialized output is also used for output_chars)
+                    turn_messages.append(
+                        {
+                            "role": "tool",
+                            "tool_call_id": tc.id,
+                            "name": tc.name,  # Required by Gemini
+                            "content": serialized_output,
+                        }
+                    )
 
-                tool_trace_summary.append(
-                    {
-                        "tool": tc.name,
-                        "input_summary": input_summary,
-                        "duration_ms": duration_ms,
-                        "output_chars": output_chars,
-                    }
-                )
+                    # Track for logging and context history
+                    input_dict = {"tool": tc.name, **tc.arguments}
+                    input_summary = _summarize_input(normalized_tool_name, tc.arguments)
+
+                    # Extract reason from tool arguments (if provided)
+                    tool_reason = tc.arguments.get("reason")
+
+                    turn_trace.append(
+                        ToolCall(
+                            tool=tc.name,
+                            reason=tool_reason,
+                            input=input_dict,
+                            output=output,
+                            duration_ms=duration_ms,
+                            iteration=iteration + 1,
+                        )
+                    )
 
-                # Keep context history for fallback final prompt
-                context_history.append({"tool": tc.name, "input": input_dict, "output": output})
+                    turn_trace_summary.append(
+                        {
+                            "tool": tc.name,
+                            "input_summary": input_summary,
+                            "duration_ms": duration_ms,
+                            "output_chars": len(serialized_output),
+                        }
+                    )
 
-    # Should not reach here
-    answer = "I was unable to formulate a complete answer within the iteration limit."
-    _log_completion(answer, max_iterations, forced=True)
-    return ReflectAgentResult(
-        text=answer,
-        iterations=max_iterations,
-        tools_called=total_tools_called,
-        tool_trace=tool_trace,
-        llm_trace=_get_llm_trace(),
-        usage=_get_usage(),
-        directives_applied=directives_applied,
-    )
+                    # Keep context history for fallback final prompt. Repeated calls returning the
+                    # same data are pasted into that prompt only once.
+                    context_key = (normalized_tool_name, serialized_output)
+                    if context_key not in context_history_keys:
+                        context_history_keys.add(context_key)
+                        context_history.append(
+                            {"tool": tc.name, "input": input_dict, "output": output, "output_json": serialized_output}
+                        )
+
+                messages.extend(turn_messages)
+                tool_trace.extend(turn_trace)
+                tool_trace_summary.extend(turn_trace_summary)
+
+        # Should not reach here
+        answer = "I was unable to formulate a complete answer within the iteration limit."
+        _log_completion(answer, max_iterations, forced=True)
+        return ReflectAgentResult(
+            text=answer,
+            iterations=max_iterations,
+            tools_called=total_tools_called,
+            tool_trace=tool_trace,
+            llm_trace=_get_llm_trace(),
+            usage=_get_usage(),
+            directives_applied=directives_applied,
+        )
+    finally:
+        # Stop backend calls nobody will await once the run ends (including on cancellation)
+        tool_cache.close()
+        expand_coalescer.close()
 
 
 def _tool_call_to_dict(tc: "LLMToolCall") -> dict[str, Any]:
@@ -788,11 +815,38 @@ def _tool_call_to_dict(tc: "LLMToolCall") -> dict[str, Any]:
         "type": "function",
         "function": {
             "name": tc.name,
-            "arguments": json.dumps(tc.arguments),
+            # Stable key order keeps replayed turns byte-identical for provider prefix caching
+            "arguments": json_utils.dumps(tc.arguments, sort_keys=True),
         },
     }
 
 
+def _track_result_ids(
+    tool_name: str,
+    output: Any,
+    available_memory_ids: set[str],
+    available_mental_model_ids: set[str],
+    available_observation_ids: set[str],
+) -> int:
+    """Record the IDs returned by a retrieval tool. Returns how many new IDs were added."""
+    match tool_name:
+        case "search_mental_models":
+            key, target = "mental_models", available_mental_model_ids
+        case "search_observations":
+            key, target = "observations", available_observation_ids
+        case "recall":
+            key, target = "memories", available_memory_ids
+        case _:
+            return 0
+
+    if not isinstance(output, dict) or key not in output:
+        return 0
+
+    before = len(target)
+    target.update(item["id"] for item in output[key] if "id" in item)
+    return len(target) - before
+
+
 async def _process_done_tool(
     done_call: "LLMToolCall",
     available_memory_ids: set[str],
@@ -818,10 +872,14 @@ async def _process_done_tool(
     if not answer:
         answer = "No answer provided."
 
-    # Validate IDs (only include IDs that were actually retrieved)
-    used_memory_ids = [mid for mid in (args.get("memory_ids") or []) if mid in available_memory_ids]
-    used_mental_model_ids = [mid for mid in (args.get("mental_model_ids") or []) if mid in available_mental_model_ids]
-    used_observation_ids = [oid for oid in (args.get("observation_ids") or []) if oid in available_observation_ids]
+    # Validate IDs (only include IDs that were actually retrieved), dropping repeated citations
+    used_memory_ids = [mid for mid in dict.fromkeys(args.get("memory_ids") or []) if mid in available_memory_ids]
+    used_mental_model_ids = [
+        mid for mid in dict.fromkeys(args.get("mental_model_ids") or []) if mid in available_mental_model_ids
+    ]
+    used_observation_ids = [
+        oid for oid in dict.fromkeys(args.get("observation_ids") or []) if oid in available_observation_ids
+    ]
 
     # Generate structured output if schema provided
     structured_output = None
@@ -853,6 +911,43 @@ async def _process_done_tool(
     )
 
 
+async def _run_tool_call(
+    tc: "LLMToolCall",
+    reflect_id: str,
+    search_mental_models_fn: Callable[[str, int], Awaitable[dict[str, Any]]],
+    search_observations_fn: Callable[[str, int], Awaitable[dict[str, Any]]],
+    recall_fn: Callable[[str, int, int], Awaitable[dict[str, Any]]],
+    expand_fn: Callable[[list[str], str], Awaitable[dict[str, Any]]],
+) -> tuple[Any, int, str]:
+    """Execute one tool call and serialize its output.
+
+    Failures become an error output for the LLM instead of propagating, so one broken
+    tool never cancels the other tools running in the same turn.
+
+    Returns:
+        Tuple of (output, duration_ms, serialized output)
+    """
+    try:
+        output, duration_ms = await _execute_tool_with_timing(
+            tc,
+            search_mental_models_fn,
+            search_observations_fn,
+            recall_fn,
+            expand_fn,
+        )
+    except Exception as e:
+        # Tool execution failed - send error back to LLM so it can try again
+        logger.warning(f"[REFLECT {reflect_id}] Tool {tc.name} failed with exception: {e}")
+        output = {"error": f"Tool execution failed: {e}"}
+        duration_ms = 0
+    try:
+        output_json = json_utils.dumps(output, default=str)
+    except TypeError:
+        # orjson rejects integers beyond 64 bits and very deep nesting even with default=str
+        output_json = str(output)
+    return output, duration_ms, output_json
+
+
 async def _execute_tool_with_timing(
     tc: "LLMToolCall",
     search_mental_models_fn: Callable[[str, int], Awaitable[dict[str, Any]]],
@@ -863,7 +958,7 @@ async def _execute_tool_with_timing(
     """Execute a tool call and return result with timing."""
     from hindsight_api.tracing import get_tracer
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     # Create span for tool execution
     tracer = get_tracer()
@@ -882,11 +977,11 @@ async def _execute_tool_with_timing(
         # Set attributes
         span.set_attribute("hindsight.tool.name", normalized_name)
         span.set_attribute("hindsight.tool.id", tc.id)
-        span.set_attribute("hindsight.tool.arguments", json.dumps(tc.arguments))
+        span.set_attribute("hindsight.tool.arguments", json_utils.dumps(tc.arguments))
 
         try:
             result = await _execute_tool(
-                tc.name,
+                normalized_name,
                 tc.arguments,
                 search_mental_models_fn,
                 search_observations_fn,
@@ -904,7 +999,7 @@ async def _execute_tool_with_timing(
 
                 span.set_status(Status(StatusCode.OK))
 
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
             span.set_attribute("hindsight.tool.duration_ms", duration_ms)
 
             # End span with correct timestamp
@@ -917,7 +1012,7 @@ async def _execute_tool_with_timing(
 
             span.set_status(Status(StatusCode.ERROR, str(e)))
             span.record_exception(e)
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
             span.set_attribute("hindsight.tool.duration_ms", duration_ms)
             end_time_ns = time.time_ns()
             span.end(end_time=end_time_ns)
@@ -932,72 +1027,69 @@ async def _execute_tool(
     recall_fn: Callable[[str, int, int], Awaitable[dict[str, Any]]],
     expand_fn: Callable[[list[str], str], Awaitable[dict[str, Any]]],
 ) -> dict[str, Any]:
-    """Execute a single tool by name."""
-    # Normalize tool name for various LLM output formats
-    tool_name = _normalize_tool_name(tool_name)
-
-    if tool_name == "search_mental_models":
-        query = args.get("query")
-        if not query:
-            return {"error": "search_mental_models requires a query parameter"}
-        max_results = int(args.get("max_results") or 5)
-        return await search_mental_models_fn(query, max_results)
-
-    elif tool_name == "search_observations":
-        query = args.get("query")
-        if not query:
-            return {"error": "search_observations requires a query parameter"}
-        max_tokens = max(int(args.get("max_tokens") or 5000), 1000)  # Default 5000, min 1000
-        return await search_observations_fn(query, max_tokens)
-
-    elif tool_name == "recall":
-        query = args.get("query")
-        if not query:
-            return {"error": "recall requires a query parameter"}
-        max_tokens = max(int(args.get("max_tokens") or 2048), 1000)  # Default 2048, min 1000
-        max_chunk_tokens = max(int(args.get("max_chunk_tokens") or 1000), 1000)  # Always enabled, min 1000
-        return await recall_fn(query, max_tokens, max_chunk_tokens)
-
-    elif tool_name == "expand":
-        memory_ids = args.get("memory_ids", [])
-        if not memory_ids:
-            return {"error": "expand requires memory_ids"}
-        depth = args.get("depth", "chunk")
-        return await expand_fn(memory_ids, depth)
-
-    else:
-        return {"error": f"Unknown tool: {tool_name}"}
+    """Execute a single tool by its normalized name."""
+    match tool_name:
+        case "search_mental_models":
+            query = args.get("query")
+            if not query:
+                return {"error": "search_mental_models requires a query parameter"}
+            max_results = int(args.get("max_results") or 5)
+            return await search_mental_models_fn(query, max_results)
+
+        case "search_observations":
+            query = args.get("query")
+            if not query:
+                return {"error": "search_observations requires a query parameter"}
+            max_tokens = max(int(args.get("max_tokens") or 5000), 1000)  # Default 5000, min 1000
+            return await search_observations_fn(query, max_tokens)
+
+        case "recall":
+            query = args.get("query")
+            if not query:
+                return {"error": "recall requires a query parameter"}
+            max_tokens = max(int(args.get("max_tokens") or 2048), 1000)  # Default 2048, min 1000
+            max_chunk_tokens = max(int(args.get("max_chunk_tokens") or 1000), 1000)  # Always enabled, min 1000
+            return await recall_fn(query, max_tokens, max_chunk_tokens)
+
+        case "expand":
+            memory_ids = args.get("memory_ids", [])
+            if not memory_ids:
+                return {"error": "expand requires memory_ids"}
+            depth = args.get("depth", "chunk")
+            return await expand_fn(memory_ids, depth)
+
+        case _:
+            return {"error": f"Unknown tool: {tool_name}"}
 
 
 def _summarize_input(tool_name: str, args: dict[str, Any]) -> str:
     """Create a summary of tool input for logging, showing all params."""
-    if tool_name == "search_mental_models":
-        query = args.get("query", "")
-        query_preview = f"'{query[:30]}...'" if len(query) > 30 else f"'{query}'"
-        max_results = int(args.get("max_results") or 5)
-        return f"(query={query_preview}, max_results={max_results})"
-    elif tool_name == "search_observations":
-        query = args.get("query", "")
-        query_preview = f"'{query[:30]}...'" if len(query) > 30 else f"'{query}'"
-        max_tokens = max(int(args.get("max_tokens") or 5000), 1000)
-        return f"(query={query_preview}, max_tokens={max_tokens})"
-    elif tool_name == "recall":
-        query = args.get("query", "")
-        query_preview = f"'{query[:30]}...'" if len(query) > 30 else f"'{query}'"
-        max_tokens = max(int(args.get("max_tokens") or 2048), 1000)
-        max_chunk_tokens = max(int(args.get("max_chunk_tokens") or 1000), 1000)
-        return f"(query={query_preview}, max_tokens={max_tokens}, max_chunk_tokens={max_chunk_tokens})"
-    elif tool_name == "expand":
-        memory_ids = args.get("memory_ids", [])
-        depth = args.get("depth", "chunk")
-        return f"(memory_ids=[{len(memory_ids)} ids], depth={depth})"
-    elif tool_name == "done":
-        answer = args.get("answer", "")
-        answer_preview = f"'{answer[:30]}...'" if len(answer) > 30 else f"'{answer}'"
-        memory_ids = args.get("memory_ids", [])
-        mental_model_ids = args.get("mental_model_ids", [])
-        observation_ids = args.get("observation_ids", [])
-        return (
-            f"(answer={answer_preview}, mem={len(memory_ids)}, mm={len(mental_model_ids)}, obs={len(observation_ids)})"
-        )
+    match tool_name:
+        case "search_mental_models":
+            query = args.get("query", "")
+            query_preview = f"'{query[:30]}...'" if len(query) > 30 else f"'{query}'"
+            max_results = int(args.get("max_results") or 5)
+            return f"(query={query_preview}, max_results={max_results})"
+        case "search_observations":
+            query = args.get("query", "")
+            query_preview = f"'{query[:30]}...'" if len(query) > 30 else f"'{query}'"
+            max_tokens = max(int(args.get("max_tokens") or 5000), 1000)
+            return f"(query={query_preview}, max_tokens={max_tokens})"
+        case "recall":
+            query = args.get("query", "")
+            query_preview = f"'{query[:30]}...'" if len(query) > 30 else f"'{query}'"
+            max_tokens = max(int(args.get("max_tokens") or 2048), 1000)
+            max_chunk_tokens = max(int(args.get("max_chunk_tokens") or 1000), 1000)
+            return f"(query={query_preview}, max_tokens={max_tokens}, max_chunk_tokens={max_chunk_tokens})"
+        case "expand":
+            memory_ids = args.get("memory_ids", [])
+            depth = args.get("depth", "chunk")
+            return f"(memory_ids=[{len(memory_ids)} ids], depth={depth})"
+        case "done":
+            answer = args.get("answer", "")
+            answer_preview = f"'{answer[:30]}...'" if len(answer) > 30 else f"'{answer}'"
+            memory_ids = args.get("memory_ids", [])
+            mental_model_ids = args.get("mental_model_ids", [])
+            observation_ids = args.get("observation_ids", [])
+            return f"(answer={answer_preview}, mem={len(memory_ids)}, mm={len(mental_model_ids)}, obs={len(observation_ids)})"
     return str(args)
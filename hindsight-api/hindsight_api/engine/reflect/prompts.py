@@ -7,9 +7,11 @@ The reflect agent uses hierarchical retrieval:
 3. recall - Raw facts as ground truth fallback
 """
 
-import json
+from functools import lru_cache
 from typing import Any
 
+from .. import json_utils
+
 
 def _extract_directive_rules(directives: list[dict[str, Any]]) -> list[str]:
     """Extract directive rules as a list of strings."""
@@ -29,29 +31,21 @@ def build_directives_section(directives: list[dict[str, Any]]) -> str:
     """
     if not directives:
         return ""
+    return _format_directives_section(_extract_directive_rules(directives))
 
-    rules = _extract_directive_rules(directives)
-    if not rules:
-        return ""
 
-    parts = [
-        "## DIRECTIVES (MANDATORY)",
-        "These are hard rules you MUST follow in ALL responses:",
-        "",
-    ]
+_DIRECTIVES_SECTION_HEADER = "## DIRECTIVES (MANDATORY)\nThese are hard rules you MUST follow in ALL responses:\n\n"
+_DIRECTIVES_SECTION_FOOTER = (
+    "\n\nNEVER violate these directives, even if other context suggests otherwise."
+    "\nIMPORTANT: Do NOT explain or justify how you handled directives in your answer. Just follow them silently.\n"
+)
 
-    for rule in rules:
-        parts.append(f"- {rule}")
 
-    parts.extend(
-        [
-            "",
-            "NEVER violate these directives, even if other context suggests otherwise.",
-            "IMPORTANT: Do NOT explain or justify how you handled directives in your answer. Just follow them silently.",
-            "",
-        ]
-    )
-    return "\n".join(parts)
+def _format_directives_section(rules: list[str]) -> str:
+    """Format already-extracted directive rules as the system prompt section."""
+    if not rules:
+        return ""
+    return _DIRECTIVES_SECTION_HEADER + "\n".join(f"- {rule}" for rule in rules) + _DIRECTIVES_SECTION_FOOTER
 
 
 def build_directives_reminder(directives: list[dict[str, Any]]) -> str:
@@ -63,65 +57,44 @@ def build_directives_reminder(directives: list[dict[str, Any]]) -> str:
     """
     if not directives:
         return ""
+    return _format_directives_reminder(_extract_directive_rules(directives))
+
+
+_DIRECTIVES_REMINDER_HEADER = (
+    "\n## REMINDER: MANDATORY DIRECTIVES"
+    "\nBefore responding, ensure your answer complies with ALL of these directives:\n\n"
+)
+_DIRECTIVES_REMINDER_FOOTER = (
+    "\n\nYour response will be REJECTED if it violates any directive above."
+    "\nDo NOT include any commentary about how you handled directives - just follow them."
+)
 
-    rules = _extract_directive_rules(directives)
+
+def _format_directives_reminder(rules: list[str]) -> str:
+    """Format already-extracted directive rules as the end-of-prompt reminder."""
     if not rules:
         return ""
+    numbered = "\n".join(f"{i}. {rule}" for i, rule in enumerate(rules, 1))
+    return _DIRECTIVES_REMINDER_HEADER + numbered + _DIRECTIVES_REMINDER_FOOTER
 
-    parts = [
-        "",
-        "## REMINDER: MANDATORY DIRECTIVES",
-        "Before responding, ensure your answer complies with ALL of these directives:",
-        "",
-    ]
 
-    for i, rule in enumerate(rules, 1):
-        parts.append(f"{i}. {rule}")
+_ANTI_HALLUCINATION_RULE = (
+    "CRITICAL: You MUST ONLY use information from retrieved tool results. "
+    "NEVER make up names, people, events, or entities."
+)
 
-    parts.append("")
-    parts.append("Your response will be REJECTED if it violates any directive above.")
-    parts.append("Do NOT include any commentary about how you handled directives - just follow them.")
-    return "\n".join(parts)
+_ADDITIONAL_CONTEXT_HEADER = "## Additional Context\n"
 
 
-def build_system_prompt_for_tools(
-    bank_profile: dict[str, Any],
-    context: str | None = None,
-    directives: list[dict[str, Any]] | None = None,
-    has_mental_models: bool = False,
-    budget: str | None = None,
-) -> str:
+@lru_cache(maxsize=16)
+def _build_tool_instructions(has_mental_models: bool, budget: str | None) -> str:
     """
-    Build the system prompt for tool-calling reflect agent.
-
-    The agent uses hierarchical retrieval:
-    1. search_mental_models - User-curated summaries (try first, if available)
-    2. search_observations - Consolidated knowledge with freshness
-    3. recall - Raw facts as ground truth
+    Build the invariant instruction body of the tool-calling system prompt.
 
-    Args:
-        bank_profile: Bank profile with name and mission
-        context: Optional additional context
-        directives: Optional list of directive mental models to inject as hard rules
-        has_mental_models: Whether the bank has any mental models (skip if not)
-        budget: Search depth budget - "low", "mid", or "high". Controls exploration thoroughness.
+    Only depends on whether the bank has mental models and on the (lowercased) budget,
+    so it is built once per combination and reused byte-for-byte across requests.
     """
-    name = bank_profile.get("name", "Assistant")
-    mission = bank_profile.get("mission", "")
-
-    parts = []
-
-    # Anti-hallucination rule at the very top
-    parts.extend(
-        [
-            "CRITICAL: You MUST ONLY use information from retrieved tool results. NEVER make up names, people, events, or entities.",
-            "",
-        ]
-    )
-
-    # Inject directives after anti-hallucination rule
-    if directives:
-        parts.append(build_directives_section(directives))
+    parts: list[str] = []
 
     parts.extend(
         [
@@ -215,44 +188,42 @@ def build_system_prompt_for_tools(
     )
 
     # Add budget guidance
-    if budget:
-        budget_lower = budget.lower()
-        if budget_lower == "low":
-            parts.extend(
-                [
-                    "## RESEARCH DEPTH: SHALLOW (Quick Response)",
-                    "- Prioritize speed over completeness",
-                    "- If mental models or observations provide a reasonable answer, stop there",
-                    "- Only dig deeper if the initial results are clearly insufficient",
-                    "- Prefer a quick overview rather than exhaustive details",
-                    "- Answer promptly with available information",
-                    "",
-                ]
-            )
-        elif budget_lower == "mid":
-            parts.extend(
-                [
-                    "## RESEARCH DEPTH: MODERATE (Balanced)",
-                    "- Balance thoroughness with efficiency",
-                    "- Check multiple sources when the question warrants it",
-                    "- Verify stale data if it's central to the answer",
-                    "- Don't over-explore, but ensure reasonable coverage",
-                    "",
-                ]
-            )
-        elif budget_lower == "high":
-            parts.extend(
-                [
-                    "## RESEARCH DEPTH: DEEP (Thorough Exploration)",
-                    "- Explore comprehensively before answering",
-                    "- Search across all available knowledge levels",
-                    "- Use multiple query variations to ensure coverage",
-                    "- Verify information across different retrieval levels",
-                    "- Use expand() to get full context on important memories",
-                    "- Take time to synthesize a complete, well-researched answer",
-                    "",
-                ]
-            )
+    if budget == "low":
+        parts.extend(
+            [
+                "## RESEARCH DEPTH: SHALLOW (Quick Response)",
+                "- Prioritize speed over completeness",
+                "- If mental models or observations provide a reasonable answer, stop there",
+                "- Only dig deeper if the initial results are clearly insufficient",
+                "- Prefer a quick overview rather than exhaustive details",
+                "- Answer promptly with available information",
+                "",
+            ]
+        )
+    elif budget == "mid":
+        parts.extend(
+            [
+                "## RESEARCH DEPTH: MODERATE (Balanced)",
+                "- Balance thoroughness with efficiency",
+                "- Check multiple sources when the question warrants it",
+                "- Verify stale data if it's central to the answer",
+                "- Don't over-explore, but ensure reasonable coverage",
+                "",
+            ]
+        )
+    elif budget == "high":
+        parts.extend(
+            [
+                "## RESEARCH DEPTH: DEEP (Thorough Exploration)",
+                "- Explore comprehensively before answering",
+                "- Search across all available knowledge levels",
+                "- Use multiple query variations to ensure coverage",
+                "- Verify information across different retrieval levels",
+                "- Use expand() to get full context on important memories",
+                "- Take time to synthesize a complete, well-researched answer",
+                "",
+            ]
+        )
 
     parts.append("## Workflow")
 
@@ -290,6 +261,49 @@ def build_system_prompt_for_tools(
         ]
     )
 
+    return "\n".join(parts)
+
+
+def build_system_prompt_for_tools(
+    bank_profile: dict[str, Any],
+    context: str | None = None,
+    directives: list[dict[str, Any]] | None = None,
+    has_mental_models: bool = False,
+    budget: str | None = None,
+    directive_rules: list[str] | None = None,
+) -> str:
+    """
+    Build the system prompt for tool-calling reflect agent.
+
+    The agent uses hierarchical retrieval:
+    1. search_mental_models - User-curated summaries (try first, if available)
+    2. search_observations - Consolidated knowledge with freshness
+    3. recall - Raw facts as ground truth
+
+    Args:
+        bank_profile: Bank profile with name and mission
+        context: Optional additional context
+        directives: Optional list of directive mental models to inject as hard rules
+        has_mental_models: Whether the bank has any mental models (skip if not)
+        budget: Search depth budget - "low", "mid", or "high". Controls exploration thoroughness.
+        directive_rules: Rules already extracted from directives (skips re-extracting them)
+    """
+    name = bank_profile.get("name", "Assistant")
+    mission = bank_profile.get("mission", "")
+
+    # Anti-hallucination rule at the very top
+    parts = [_ANTI_HALLUCINATION_RULE, ""]
+
+    # Extract directive rules once for both the opening section and the closing reminder
+    if directive_rules is None:
+        directive_rules = _extract_directive_rules(directives) if directives else []
+
+    # Inject directives after anti-hallucination rule
+    if directive_rules:
+        parts.append(_format_directives_section(directive_rules))
+
+    parts.append(_build_tool_instructions(has_mental_models, budget.lower() if budget else None))
+
     parts.append("")
     parts.append(f"## Memory Bank: {name}")
 
@@ -297,28 +311,120 @@ def build_system_prompt_for_tools(
         parts.append(f"Mission: {mission}")
 
     # Disposition traits
-    disposition = bank_profile.get("disposition", {})
-    if disposition:
-        traits = []
-        if "skepticism" in disposition:
-            traits.append(f"skepticism={disposition['skepticism']}")
-        if "literalism" in disposition:
-            traits.append(f"literalism={disposition['literalism']}")
-        if "empathy" in disposition:
-            traits.append(f"empathy={disposition['empathy']}")
-        if traits:
-            parts.append(f"Disposition: {', '.join(traits)}")
+    if disposition := _format_disposition(_disposition_traits(bank_profile.get("disposition"))):
+        parts.append(disposition)
 
     if context:
-        parts.append(f"\n## Additional Context\n{context}")
+        parts.append(f"\n{_ADDITIONAL_CONTEXT_HEADER}{context}")
 
     # Add directive reminder at the END for recency effect
-    if directives:
-        parts.append(build_directives_reminder(directives))
+    if directive_rules:
+        parts.append(_format_directives_reminder(directive_rules))
 
     return "\n".join(parts)
 
 
+_AGENT_INSTRUCTIONS_CONTINUE = (
+    "\n## Instructions\n"
+    "Based on the tool results above, either call more tools or provide your final answer. "
+    "Synthesize and reason from the data - make reasonable inferences when helpful. "
+    "If you have related information, use it to give the best possible answer."
+)
+_AGENT_INSTRUCTIONS_START = (
+    "\n## Instructions\n"
+    "Start by searching for relevant information using the hierarchical retrieval strategy:\n"
+    "1. Try search_mental_models() first for curated summaries\n"
+    "2. Try search_observations() for consolidated knowledge\n"
+    "3. Use recall() for specific details or to verify stale data"
+)
+_FINAL_INSTRUCTIONS = (
+    "\n## Instructions\n"
+    "Provide a thoughtful answer by synthesizing and reasoning from the retrieved data above. "
+    "You can make reasonable inferences from the memories, but don't completely fabricate information. "
+    "If the exact answer isn't stated, use what IS stated to give the best possible answer. "
+    "Only say 'I don't have information' if the retrieved data is truly unrelated to the question.\n\n"
+    "IMPORTANT: Output ONLY the final answer. Do NOT include meta-commentary like "
+    '"I\'ll search..." or "Let me analyze...". Do NOT explain your reasoning process. '
+    "Just provide the direct synthesized answer."
+)
+
+
+_DISPOSITION_TRAITS = ("skepticism", "literalism", "empathy")
+
+
+def _disposition_traits(disposition: dict[str, Any] | None) -> tuple[str, ...]:
+    """
+    Return the set disposition traits as formatted "trait=value" strings in display order.
+
+    Formatting before caching keeps values that hash equal but print differently (1, 1.0,
+    True) apart, and lets unhashable values through.
+    """
+    if not disposition:
+        return ()
+    return tuple(f"{trait}={disposition[trait]}" for trait in _DISPOSITION_TRAITS if trait in disposition)
+
+
+@lru_cache(maxsize=128)
+def _format_disposition(traits: tuple[str, ...]) -> str:
+    """Format disposition traits as a 'Disposition: ...' line, or "" if none are set."""
+    if not traits:
+        return ""
+    return f"Disposition: {', '.join(traits)}"
+
+
+@lru_cache(maxsize=256, typed=True)
+def _format_bank_header(name: str, mission: str, traits: tuple[str, ...]) -> str:
+    """
+    Format the bank identity header shared by the user prompts.
+
+    Depends only on the bank profile, so the agent loop reuses the same string on every turn.
+    """
+    disposition = _format_disposition(traits)
+    return (
+        f"## Memory Bank Context\nName: {name}"
+        + (f"\nMission: {mission}" if mission else "")
+        + (f"\n{disposition}" if disposition else "")
+    )
+
+
+def _format_bank_context(bank_profile: dict, additional_context: str | None) -> str:
+    """Format the bank identity header (and caller context) shared by the user prompts."""
+    header = _format_bank_header(
+        bank_profile.get("name", "Assistant"),
+        bank_profile.get("mission", ""),
+        _disposition_traits(bank_profile.get("disposition")),
+    )
+    if additional_context:
+        return f"{header}\n\n{_ADDITIONAL_CONTEXT_HEADER}{additional_context}"
+    return header
+
+
+# Cap on how much of a single tool output is pasted into a prompt. Recall/observation
+# results stay well below this; it exists for expand(depth="document"), which can
+# return entire source documents.
+_MAX_HISTORY_OUTPUT_CHARS = 32_000
+
+
+def _format_history_output(entry: dict) -> str:
+    """Return the (size-capped) JSON text for a context history entry.
+
+    Entries recorded by the agent loop carry the JSON already sent to the LLM as the tool
+    message ("output_json"), so it is reused instead of serializing the output again.
+    """
+    output_str = entry.get("output_json")
+    if output_str is None:
+        output = entry["output"]
+        # Format as proper JSON for LLM readability
+        try:
+            output_str = json_utils.dumps(output, indent=True, default=str)
+        except (TypeError, ValueError):
+            output_str = str(output)
+    if len(output_str) > _MAX_HISTORY_OUTPUT_CHARS:
+        omitted = len(output_str) - _MAX_HISTORY_OUTPUT_CHARS
+        output_str = f"{output_str[:_MAX_HISTORY_OUTPUT_CHARS]}\n... [{omitted} characters truncated]"
+    return output_str
+
+
 def build_agent_prompt(
     query: str,
     context_history: list[dict],
@@ -326,65 +432,21 @@ def build_agent_prompt(
     additional_context: str | None = None,
 ) -> str:
     """Build the user prompt for the reflect agent."""
-    parts = []
-
-    # Bank identity
-    name = bank_profile.get("name", "Assistant")
-    mission = bank_profile.get("mission", "")
-
-    parts.append(f"## Memory Bank Context\nName: {name}")
-    if mission:
-        parts.append(f"Mission: {mission}")
-
-    # Disposition traits if present
-    disposition = bank_profile.get("disposition", {})
-    if disposition:
-        traits = []
-        if "skepticism" in disposition:
-            traits.append(f"skepticism={disposition['skepticism']}")
-        if "literalism" in disposition:
-            traits.append(f"literalism={disposition['literalism']}")
-        if "empathy" in disposition:
-            traits.append(f"empathy={disposition['empathy']}")
-        if traits:
-            parts.append(f"Disposition: {', '.join(traits)}")
-
-    # Additional context from caller
-    if additional_context:
-        parts.append(f"\n## Additional Context\n{additional_context}")
+    parts = [_format_bank_context(bank_profile, additional_context)]
 
     # Tool call history
     if context_history:
         parts.append("\n## Tool Results (synthesize and reason from this data)")
         for i, entry in enumerate(context_history, 1):
             tool = entry["tool"]
-            output = entry["output"]
-            # Format as proper JSON for LLM readability
-            try:
-                output_str = json.dumps(output, indent=2, default=str)
-            except (TypeError, ValueError):
-                output_str = str(output)
+            output_str = _format_history_output(entry)
             parts.append(f"\n### Call {i}: {tool}\n```json\n{output_str}\n```")
 
     # The question
     parts.append(f"\n## Question\n{query}")
 
     # Instructions
-    if context_history:
-        parts.append(
-            "\n## Instructions\n"
-            "Based on the tool results above, either call more tools or provide your final answer. "
-            "Synthesize and reason from the data - make reasonable inferences when helpful. "
-            "If you have related information, use it to give the best possible answer."
-        )
-    else:
-        parts.append(
-            "\n## Instructions\n"
-            "Start by searching for relevant information using the hierarchical retrieval strategy:\n"
-            "1. Try search_mental_models() first for curated summaries\n"
-            "2. Try search_observations() for consolidated knowledge\n"
-            "3. Use recall() for specific details or to verify stale data"
-        )
+    parts.append(_AGENT_INSTRUCTIONS_CONTINUE if context_history else _AGENT_INSTRUCTIONS_START)
 
     return "\n".join(parts)
 
@@ -396,44 +458,14 @@ def build_final_prompt(
     additional_context: str | None = None,
 ) -> str:
     """Build the final prompt when forcing a text response (no tools)."""
-    parts = []
-
-    # Bank identity
-    name = bank_profile.get("name", "Assistant")
-    mission = bank_profile.get("mission", "")
-
-    parts.append(f"## Memory Bank Context\nName: {name}")
-    if mission:
-        parts.append(f"Mission: {mission}")
-
-    # Disposition traits if present
-    disposition = bank_profile.get("disposition", {})
-    if disposition:
-        traits = []
-        if "skepticism" in disposition:
-            traits.append(f"skepticism={disposition['skepticism']}")
-        if "literalism" in disposition:
-            traits.append(f"literalism={disposition['literalism']}")
-        if "empathy" in disposition:
-            traits.append(f"empathy={disposition['empathy']}")
-        if traits:
-            parts.append(f"Disposition: {', '.join(traits)}")
-
-    # Additional context from caller
-    if additional_context:
-        parts.append(f"\n## Additional Context\n{additional_context}")
+    parts = [_format_bank_context(bank_profile, additional_context)]
 
     # Tool call history
     if context_history:
         parts.append("\n## Retrieved Data (synthesize and reason from this data)")
         for entry in context_history:
             tool = entry["tool"]
-            output = entry["output"]
-            # Format as proper JSON for LLM readability
-            try:
-                output_str = json.dumps(output, indent=2, default=str)
-            except (TypeError, ValueError):
-                output_str = str(output)
+            output_str = _format_history_output(entry)
             parts.append(f"\n### From {tool}:\n```json\n{output_str}\n```")
     else:
         parts.append("\n## Retrieved Data\nNo data was retrieved.")
@@ -442,16 +474,7 @@ def build_final_prompt(
     parts.append(f"\n## Question\n{query}")
 
     # Final instructions
-    parts.append(
-        "\n## Instructions\n"
-        "Provide a thoughtful answer by synthesizing and reasoning from the retrieved data above. "
-        "You can make reasonable inferences from the memories, but don't completely fabricate information. "
-        "If the exact answer isn't stated, use what IS stated to give the best possible answer. "
-        "Only say 'I don't have information' if the retrieved data is truly unrelated to the question.\n\n"
-        "IMPORTANT: Output ONLY the final answer. Do NOT include meta-commentary like "
-        '"I\'ll search..." or "Let me analyze...". Do NOT explain your reasoning process. '
-        "Just provide the direct synthesized answer."
-    )
+    parts.append(_FINAL_INSTRUCTIONS)
 
     return "\n".join(parts)
 
@@ -259,13 +259,14 @@ async def tool_expand(
         return {"error": "memory_ids is required and must not be empty"}
 
     # Validate and convert UUIDs
-    valid_uuids: list[uuid.UUID] = []
+    uuid_by_id: dict[str, uuid.UUID] = {}
     errors: dict[str, str] = {}
     for mid in memory_ids:
         try:
-            valid_uuids.append(uuid.UUID(mid))
+            uuid_by_id[mid] = uuid.UUID(mid)
         except ValueError:
             errors[mid] = f"Invalid memory_id format: {mid}"
+    valid_uuids = list(uuid_by_id.values())
 
     if not valid_uuids:
         return {"error": "No valid memory IDs provided", "details": errors}
@@ -325,12 +326,12 @@ async def tool_expand(
 
     # Build results
     results: list[dict[str, Any]] = []
-    for mid, mem_uuid in zip(memory_ids, valid_uuids):
+    for mid in memory_ids:
         if mid in errors:
             results.append({"memory_id": mid, "error": errors[mid]})
             continue
 
-        memory = memory_map.get(mem_uuid)
+        memory = memory_map.get(uuid_by_id[mid])
         if not memory:
             results.append({"memory_id": mid, "error": f"Memory not found: {mid}"})
             continue
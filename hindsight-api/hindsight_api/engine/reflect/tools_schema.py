@@ -8,6 +8,8 @@ The reflect agent uses a hierarchical retrieval strategy:
 3. recall - Raw facts (world/experience) as ground truth fallback
 """
 
+from functools import lru_cache
+
 # Tool definitions in OpenAI format
 
 TOOL_SEARCH_MENTAL_MODELS = {
@@ -243,17 +245,19 @@ def get_reflect_tools(directive_rules: list[str] | None = None) -> list[dict]:
     Returns:
         List of tool definitions in OpenAI format
     """
-    tools = [
+    return list(_build_reflect_tools(tuple(directive_rules) if directive_rules else ()))
+
+
+@lru_cache(maxsize=64)
+def _build_reflect_tools(directive_rules: tuple[str, ...]) -> tuple[dict, ...]:
+    """Build (once per distinct rule set) the reflect tool definitions."""
+    # Use directive-aware done tool if directives are present
+    done_tool = _build_done_tool_with_directives(list(directive_rules)) if directive_rules else TOOL_DONE_ANSWER
+
+    return (
         TOOL_SEARCH_MENTAL_MODELS,
         TOOL_SEARCH_OBSERVATIONS,
         TOOL_RECALL,
         TOOL_EXPAND,
-    ]
-
-    # Use directive-aware done tool if directives are present
-    if directive_rules:
-        tools.append(_build_done_tool_with_directives(directive_rules))
-    else:
-        tools.append(TOOL_DONE_ANSWER)
-
-    return tools
+        done_tool,
+    )
@@ -2,6 +2,8 @@
 Cross-encoder neural reranking for search results.
 """
 
+import asyncio
+
 from .types import MergedCandidate, ScoredResult
 
 
@@ -27,22 +29,27 @@ class CrossEncoderReranker:
             cross_encoder = create_cross_encoder_from_env()
         self.cross_encoder = cross_encoder
         self._initialized = False
+        self._init_lock = asyncio.Lock()
 
     async def ensure_initialized(self):
         """Ensure the cross-encoder model is initialized (for lazy initialization)."""
+        # Fast path: once initialized, every recall returns here without touching the lock
         if self._initialized:
             return
 
-        import asyncio
-
-        cross_encoder = self.cross_encoder
-        # For local providers, run in thread pool to avoid blocking event loop
-        if cross_encoder.provider_name == "local":
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, lambda: asyncio.run(cross_encoder.initialize()))
-        else:
-            await cross_encoder.initialize()
-        self._initialized = True
+        # Concurrent first recalls wait for a single initialization instead of each loading the model
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            cross_encoder = self.cross_encoder
+            # For local providers, run in thread pool to avoid blocking event loop
+            if cross_encoder.provider_name == "local":
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(None, lambda: asyncio.run(cross_encoder.initialize()))
+            else:
+                await cross_encoder.initialize()
+            self._initialized = True
 
     async def rerank(self, query: str, candidates: list[MergedCandidate]) -> list[ScoredResult]:
         """
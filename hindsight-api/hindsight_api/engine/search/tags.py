@@ -12,6 +12,7 @@ OR matching (any/any_strict): Memory matches if ANY of its tags overlap with req
 AND matching (all/all_strict): Memory matches if ALL request tags are present in its tags
 """
 
+from functools import lru_cache
 from typing import Literal
 
 TagsMatch = Literal["any", "all", "any_strict", "all_strict"]
@@ -39,6 +40,42 @@ def _parse_tags_match(match: TagsMatch) -> tuple[str, bool]:
         return "&&", True
 
 
+# Containment of a one-element array is the same test as overlapping it, and the overlap
+# operator gives the planner the simpler GIN path, so single-tag "all" filters use "&&".
+_SINGLE_TAG_MATCH: dict[str, TagsMatch] = {"all": "any", "all_strict": "any_strict"}
+
+
+@lru_cache(maxsize=64)
+def _tags_clause_template(table_alias: str, match: TagsMatch) -> str:
+    """
+    Build the tags WHERE clause for an alias/mode pair, with a %d slot for the parameter number.
+
+    Only a handful of pairs occur in practice, so each template is built once and the
+    per-query work is a single integer substitution.
+    """
+    column = f"{table_alias}tags" if table_alias else "tags"
+    operator, include_untagged = _parse_tags_match(match)
+
+    if include_untagged:
+        # Include untagged memories (NULL or empty array) OR matching tags
+        return f"AND ({column} IS NULL OR {column} = '{{}}' OR {column} {operator} $%d)"
+    # Strict: only memories with matching tags (exclude NULL and empty)
+    return f"AND {column} IS NOT NULL AND {column} != '{{}}' AND {column} {operator} $%d"
+
+
+@lru_cache(maxsize=256)
+def _tags_clause(table_alias: str, match: TagsMatch, param_num: int, single_tag: bool) -> str:
+    """
+    Return the finished tags WHERE clause.
+
+    Every input is a small hashable value (call sites use fixed parameter numbers), so the
+    recall hot path gets the clause string back without formatting anything.
+    """
+    if single_tag:
+        match = _SINGLE_TAG_MATCH.get(match, match)
+    return _tags_clause_template(table_alias, match) % param_num
+
+
 def build_tags_where_clause(
     tags: list[str] | None,
     param_offset: int = 1,
@@ -54,6 +91,9 @@ def build_tags_where_clause(
     - "any_strict": OR matching, excludes untagged memories
     - "all_strict": AND matching, excludes untagged memories
 
+    With a single tag, AND matching is emitted as an overlap (``&&``) test, which is
+    equivalent to containment for a one-element array.
+
     Args:
         tags: List of tags to filter by. If None or empty, returns empty clause (no filtering).
         param_offset: Starting parameter number for SQL placeholders (default 1).
@@ -73,17 +113,7 @@ def build_tags_where_clause(
     if not tags:
         return "", [], param_offset
 
-    column = f"{table_alias}tags" if table_alias else "tags"
-    operator, include_untagged = _parse_tags_match(match)
-
-    if include_untagged:
-        # Include untagged memories (NULL or empty array) OR matching tags
-        clause = f"AND ({column} IS NULL OR {column} = '{{}}' OR {column} {operator} ${param_offset})"
-    else:
-        # Strict: only memories with matching tags (exclude NULL and empty)
-        clause = f"AND {column} IS NOT NULL AND {column} != '{{}}' AND {column} {operator} ${param_offset}"
-
-    return clause, [tags], param_offset + 1
+    return _tags_clause(table_alias, match, param_offset, len(tags) == 1), [tags], param_offset + 1
 
 
 def build_tags_where_clause_simple(
@@ -110,15 +140,7 @@ def build_tags_where_clause_simple(
     if not tags:
         return ""
 
-    column = f"{table_alias}tags" if table_alias else "tags"
-    operator, include_untagged = _parse_tags_match(match)
-
-    if include_untagged:
-        # Include untagged memories (NULL or empty array) OR matching tags
-        return f"AND ({column} IS NULL OR {column} = '{{}}' OR {column} {operator} ${param_num})"
-    else:
-        # Strict: only memories with matching tags (exclude NULL and empty)
-        return f"AND {column} IS NOT NULL AND {column} != '{{}}' AND {column} {operator} ${param_num}"
+    return _tags_clause(table_alias, match, param_num, len(tags) == 1)
 
 
 def filter_results_by_tags(
@@ -5,6 +5,7 @@ Think operation utilities for formulating answers based on agent and world facts
 import logging
 from datetime import datetime
 
+from .. import json_utils
 from ..response_models import DispositionTraits, MemoryFact
 
 logger = logging.getLogger(__name__)
@@ -50,8 +51,6 @@ def build_disposition_description(disposition: DispositionTraits) -> str:
 
 def format_facts_for_prompt(facts: list[MemoryFact]) -> str:
     """Format facts as JSON for LLM prompt."""
-    import json
-
     if not facts:
         return "[]"
     formatted = []
@@ -72,7 +71,7 @@ def format_facts_for_prompt(facts: list[MemoryFact]) -> str:
 
         formatted.append(fact_obj)
 
-    return json.dumps(formatted, indent=2)
+    return json_utils.dumps(formatted, indent=True)
 
 
 def format_entity_summaries_for_prompt(entities: dict) -> str:
@@ -492,3 +492,86 @@ async def test_config_permissions_system(memory, request_context):
 
     finally:
         await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_config_cache_invalidated_on_bank_delete(memory, request_context):
+    """Test that cached bank overrides do not survive deleting and recreating a bank."""
+    bank_id = "test-cache-delete-bank"
+
+    try:
+        await memory.get_bank_profile(bank_id, request_context=request_context)
+        resolver = memory._config_resolver
+
+        await resolver.update_bank_config(bank_id, {"retain_chunk_size": 6100})
+        config = await resolver.get_bank_config(bank_id, None)
+        assert config["retain_chunk_size"] == 6100
+
+        # Served from cache on the next read, but still a fresh dict
+        assert await resolver._load_bank_config(bank_id) == {"retain_chunk_size": 6100}
+
+        await memory.delete_bank(bank_id, request_context=request_context)
+        await memory.get_bank_profile(bank_id, request_context=request_context)
+
+        assert await resolver._load_bank_config(bank_id) == {}
+
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
+
+
+class _FlakyBatchPool:
+    """Pool stub whose batched bank config query fails while single-bank queries succeed."""
+
+    def __init__(self, configs: dict[str, str], broken: set[str]):
+        self.configs = configs
+        self.broken = broken
+        self.calls: list[list[str]] = []
+
+    async def fetch(self, query, bank_ids, fields):
+        self.calls.append(list(bank_ids))
+        if self.broken & set(bank_ids):
+            raise RuntimeError("cannot call jsonb_each on a non-object")
+        return [{"bank_id": b, "config": self.configs[b]} for b in bank_ids if b in self.configs]
+
+
+@pytest.mark.asyncio
+async def test_bank_config_batch_failure_retries_per_bank():
+    """Test that one bad bank in a coalesced batch does not drop the others' overrides."""
+    import asyncio
+
+    pool = _FlakyBatchPool({"bank-a": '{"retain_chunk_size": 1234}', "bank-b": "{}"}, broken={"bank-bad"})
+    resolver = ConfigResolver(pool=pool)
+
+    a, b, bad = await asyncio.gather(
+        resolver._load_bank_config("bank-a"),
+        resolver._load_bank_config("bank-b"),
+        resolver._load_bank_config("bank-bad"),
+    )
+
+    assert a == {"retain_chunk_size": 1234}
+    assert b == {}
+    assert bad == {}
+    assert sorted(pool.calls[0]) == ["bank-a", "bank-b", "bank-bad"]
+    assert len(pool.calls) == 4
+    # The failed bank is not cached, the healthy ones are
+    assert {key[1] for key in resolver._bank_config_cache} == {"bank-a", "bank-b"}
+
+
+@pytest.mark.asyncio
+async def test_bank_config_batch_cancelled_releases_waiters():
+    """Test that cancelling the batch task resolves the waiting lookups instead of hanging them."""
+    import asyncio
+
+    class _SlowPool:
+        async def fetch(self, *args):
+            await asyncio.sleep(3600)
+
+    resolver = ConfigResolver(pool=_SlowPool())
+    lookup = asyncio.create_task(resolver._load_bank_config("bank-a"))
+    await asyncio.sleep(0.01)
+
+    for task in list(resolver._batch_tasks):
+        task.cancel()
+
+    assert await asyncio.wait_for(lookup, timeout=1) == {}
+    assert resolver._bank_config_cache == {}
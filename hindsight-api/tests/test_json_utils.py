@@ -0,0 +1,46 @@
+"""
+Tests for the orjson-backed JSON helpers.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from hindsight_api.engine import json_utils
+
+
+def test_dumps_returns_str_that_round_trips():
+    data = {"retain_chunk_size": 4000, "mission": "Track ünïcode", "tags": ["a", "b"], "empty": None}
+
+    text = json_utils.dumps(data)
+
+    assert isinstance(text, str)
+    assert json.loads(text) == data
+    assert json_utils.loads(text) == data
+    assert json_utils.loads(text.encode()) == data
+
+
+def test_dumps_indent_and_default():
+    when = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+    text = json_utils.dumps({"a": {"b": 1}, "when": when}, indent=True, default=str)
+
+    assert '\n  "a": {\n    "b": 1\n  }' in text
+    assert json.loads(text)["when"].startswith("2024-01-02")
+
+
+def test_dumps_sort_keys_and_non_str_keys():
+    text = json_utils.dumps({"b": 1, "a": {2: "x", 1: "y"}}, sort_keys=True)
+
+    assert text.index('"a"') < text.index('"b"')
+    assert json.loads(text) == {"a": {"1": "y", "2": "x"}, "b": 1}
+
+
+def test_dumps_is_compact_utf8():
+    assert json_utils.dumps({"a": "ü", "b": [1, 2]}) == '{"a":"ü","b":[1,2]}'
+
+
+def test_loads_invalid_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("{not json")
@@ -262,6 +262,17 @@ class TestReflectToolSchemas:
         params = done_tool["function"]["parameters"]["properties"]
         assert "directive_compliance" in params
 
+    def test_get_reflect_tools_reuses_definitions(self):
+        """Test that repeated calls reuse the built tool definitions but return fresh lists."""
+        from hindsight_api.engine.reflect.tools_schema import get_reflect_tools
+
+        first = get_reflect_tools(directive_rules=["Always respond in French"])
+        second = get_reflect_tools(directive_rules=["Always respond in French"])
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert get_reflect_tools(directive_rules=["Be brief"])[-1] is not first[-1]
+
     def test_get_reflect_tools_answer_mode(self):
         """Test getting reflect tools with answer output mode."""
         from hindsight_api.engine.reflect.tools_schema import get_reflect_tools
@@ -327,3 +338,124 @@ class TestLLMToolCall:
         call = LLMToolCall(id="call_456", name="list_items", arguments={})
 
         assert call.arguments == {}
+
+
+class TestAnthropicPromptCaching:
+    """Test the prompt-cache breakpoints the Anthropic provider adds to tool calls."""
+
+    @staticmethod
+    def _llm_with_mock_create():
+        import copy
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock
+
+        from hindsight_api.engine.providers.anthropic_llm import AnthropicLLM
+
+        llm = AnthropicLLM(provider="anthropic", api_key="test-key", base_url="", model="claude-test")
+        response = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="ok")],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=2),
+        )
+        create = AsyncMock(return_value=response)
+        llm._client.messages.create = create
+
+        def sent_params():
+            # Snapshot what was sent, so later mutation cannot hide a problem
+            return copy.deepcopy(create.call_args.kwargs)
+
+        return llm, sent_params
+
+    @staticmethod
+    def _breakpoints(params):
+        found = [t for t in params["tools"] if "cache_control" in t]
+        found += [b for b in params.get("system", []) if "cache_control" in b]
+        for message in params["messages"]:
+            if isinstance(message["content"], list):
+                found += [b for b in message["content"] if "cache_control" in b]
+        return found
+
+    @pytest.mark.asyncio
+    async def test_three_ephemeral_breakpoints_without_mutating_inputs(self):
+        import copy
+
+        llm, sent_params = self._llm_with_mock_create()
+        messages = [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "What's the weather in Paris?"},
+        ]
+        tools = copy.deepcopy(SAMPLE_TOOLS)
+        messages_before = copy.deepcopy(messages)
+        tools_before = copy.deepcopy(tools)
+
+        await llm.call_with_tools(messages=messages, tools=tools)
+
+        params = sent_params()
+        breakpoints = self._breakpoints(params)
+        assert len(breakpoints) == 3
+        assert all(b["cache_control"] == {"type": "ephemeral"} for b in breakpoints)
+        assert "cache_control" in params["tools"][-1]
+        assert "cache_control" not in params["tools"][0]
+        assert params["system"] == [
+            {"type": "text", "text": "You are helpful.", "cache_control": {"type": "ephemeral"}}
+        ]
+        # A string last message becomes a single text block
+        assert params["messages"][-1]["content"] == [
+            {"type": "text", "text": "What's the weather in Paris?", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert messages == messages_before
+        assert tools == tools_before
+
+    @pytest.mark.asyncio
+    async def test_tool_result_last_message_keeps_other_blocks(self):
+        import copy
+
+        llm, sent_params = self._llm_with_mock_create()
+        first = {"type": "tool_result", "tool_use_id": "call_1", "content": "sunny"}
+        second = {"type": "tool_result", "tool_use_id": "call_2", "content": "18C"}
+        messages = [
+            {"role": "user", "content": "What's the weather in Paris?"},
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {"id": "call_1", "function": {"name": "get_weather", "arguments": '{"location": "Paris"}'}},
+                    {"id": "call_2", "function": {"name": "get_weather", "arguments": '{"unit": "celsius"}'}},
+                ],
+            },
+            {"role": "user", "content": [first, second]},
+        ]
+        messages_before = copy.deepcopy(messages)
+
+        await llm.call_with_tools(messages=messages, tools=SAMPLE_TOOLS)
+
+        params = sent_params()
+        assert params["messages"][-1]["content"] == [first, {**second, "cache_control": {"type": "ephemeral"}}]
+        assert len(self._breakpoints(params)) == 2  # no system prompt in this request
+        assert messages == messages_before
+
+    @pytest.mark.asyncio
+    async def test_tool_message_last_is_marked_as_tool_result(self):
+        llm, sent_params = self._llm_with_mock_create()
+        messages = [
+            {"role": "user", "content": "What's the weather in Paris?"},
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {"id": "call_1", "function": {"name": "get_weather", "arguments": '{"location": "Paris"}'}}
+                ],
+            },
+            {"role": "tool", "tool_call_id": "call_1", "content": "sunny"},
+        ]
+
+        await llm.call_with_tools(messages=messages, tools=SAMPLE_TOOLS)
+
+        assert sent_params()["messages"][-1] == {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": "call_1",
+                    "content": "sunny",
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+        }
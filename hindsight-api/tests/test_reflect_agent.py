@@ -7,6 +7,8 @@ These tests verify:
 3. Recovery from tool execution errors
 """
 
+import uuid
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -190,6 +192,47 @@ class TestToolNameNormalization:
         assert _is_done_tool("recall<|channel|>done") is False
 
 
+class TestFinalPrompt:
+    """Test building the forced final prompt from tool history."""
+
+    def test_oversized_tool_output_is_truncated(self):
+        from hindsight_api.engine.reflect.prompts import _MAX_HISTORY_OUTPUT_CHARS, build_final_prompt
+
+        history = [{"tool": "expand", "input": {}, "output": {"text": "x" * (_MAX_HISTORY_OUTPUT_CHARS * 2)}}]
+
+        prompt = build_final_prompt("q", history, {"name": "Test"})
+
+        assert "characters truncated]" in prompt
+        assert len(prompt) < _MAX_HISTORY_OUTPUT_CHARS + 2000
+
+    def test_bank_header_includes_disposition_and_context(self):
+        from hindsight_api.engine.reflect.prompts import build_agent_prompt
+
+        profile = {"name": "Test", "mission": "Help", "disposition": {"empathy": 4, "skepticism": 2}}
+
+        prompt = build_agent_prompt("q", [], profile, additional_context="extra")
+
+        assert prompt.startswith(
+            "## Memory Bank Context\nName: Test\nMission: Help\nDisposition: skepticism=2, empathy=4"
+            "\n\n## Additional Context\nextra"
+        )
+
+    def test_disposition_renders_each_value_as_given(self):
+        from hindsight_api.engine.reflect.prompts import build_agent_prompt
+
+        # 1, 1.0 and True hash equal; each must still render as itself regardless of call order
+        for value in (1, 1.0, True, [1, 2]):
+            prompt = build_agent_prompt("q", [], {"name": "Test", "disposition": {"skepticism": value}})
+
+            assert f"Disposition: skepticism={value}\n" in prompt
+
+    def test_bank_header_renders_name_as_given(self):
+        from hindsight_api.engine.reflect.prompts import build_agent_prompt
+
+        for name in (1, 1.0, True):
+            assert f"Name: {name}\n" in build_agent_prompt("q", [], {"name": name})
+
+
 class TestReflectAgentMocked:
     """Test reflect agent with mocked LLM outputs."""
 
@@ -358,6 +401,77 @@ class TestReflectAgentMocked:
         assert result.text == "Recovered from error"
         assert mock_llm.call_with_tools.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_cancelled_reflect_cancels_inflight_tool_calls(self, mock_llm, mock_functions):
+        """Test that cancelling the reflect run cancels backend calls still in flight."""
+        import asyncio
+
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_recall(*args):
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_functions["recall_fn"] = slow_recall
+        mock_llm.call_with_tools.return_value = LLMToolCallResult(
+            tool_calls=[LLMToolCall(id="1", name="recall", arguments={"query": "test"})],
+            finish_reason="tool_calls",
+        )
+
+        run = asyncio.create_task(
+            run_reflect_agent(
+                llm_config=mock_llm,
+                bank_id="test-bank",
+                query="test query",
+                bank_profile={"name": "Test", "mission": "Testing"},
+                **mock_functions,
+            )
+        )
+        await asyncio.wait_for(started.wait(), timeout=1)
+        run.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_unserializable_tool_output_does_not_fail_reflect(self, mock_llm, mock_functions):
+        """Test that a tool output orjson cannot encode is sent as text instead of raising."""
+        mock_functions["recall_fn"].return_value = {"memories": [{"id": "mem-1", "content": "big", "n": 2**70}]}
+
+        mock_llm.call_with_tools.side_effect = [
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(id="1", name="recall", arguments={"query": "test"}),
+                    LLMToolCall(id="2", name="search_observations", arguments={"query": "test"}),
+                ],
+                finish_reason="tool_calls",
+            ),
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(id="3", name="done", arguments={"answer": "Still answered", "memory_ids": ["mem-1"]})
+                ],
+                finish_reason="tool_calls",
+            ),
+        ]
+
+        result = await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            **mock_functions,
+        )
+
+        assert result.text == "Still answered"
+        messages = mock_llm.call_with_tools.call_args_list[1].kwargs["messages"]
+        assert any(m.get("role") == "tool" and str(2**70) in m["content"] for m in messages)
+
     @pytest.mark.asyncio
     async def test_normalizes_tool_names_in_other_tools(self, mock_llm, mock_functions):
         """Test that tool names are normalized for all tools, not just done."""
@@ -412,3 +526,193 @@ class TestReflectAgentMocked:
         # Should have a result even if no memories found
         assert result is not None
         assert result.iterations == 3
+
+    @pytest.mark.asyncio
+    async def test_repeated_tool_calls_are_cached(self, mock_llm, mock_functions):
+        """Test that identical tool calls within a run hit the backend only once."""
+        mock_llm.call_with_tools.side_effect = [
+            # Same recall twice in one parallel batch
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(id="1", name="recall", arguments={"query": "test"}),
+                    LLMToolCall(id="2", name="recall", arguments={"query": "test"}),
+                ],
+                finish_reason="tool_calls",
+            ),
+            # And again in the next iteration
+            LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="3", name="recall", arguments={"query": "test"})],
+                finish_reason="tool_calls",
+            ),
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(id="4", name="done", arguments={"answer": "Test answer", "memory_ids": ["mem-1"]})
+                ],
+                finish_reason="tool_calls",
+            ),
+        ]
+
+        result = await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            **mock_functions,
+        )
+
+        assert result.text == "Test answer"
+        assert result.tools_called == 3
+        mock_functions["recall_fn"].assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_parallel_expand_calls_are_coalesced(self, mock_llm, mock_functions):
+        """Test that expand calls in the same turn share one backend call."""
+        a, b, c = (str(uuid.uuid4()) for _ in range(3))
+
+        async def fake_expand(memory_ids, depth):
+            results = [{"memory_id": mid, "memory": {"id": mid}} for mid in memory_ids]
+            return {"results": results, "count": len(results)}
+
+        mock_functions["expand_fn"] = AsyncMock(side_effect=fake_expand)
+        mock_llm.call_with_tools.side_effect = [
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(id="1", name="expand", arguments={"memory_ids": [a, b], "depth": "chunk"}),
+                    LLMToolCall(id="2", name="expand", arguments={"memory_ids": [b, c], "depth": "chunk"}),
+                ],
+                finish_reason="tool_calls",
+            ),
+            LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="3", name="done", arguments={"answer": "Test answer"})],
+                finish_reason="tool_calls",
+            ),
+        ]
+
+        result = await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            **mock_functions,
+        )
+
+        mock_functions["expand_fn"].assert_called_once_with([a, b, c], "chunk")
+        outputs = [[r["memory_id"] for r in tc.output["results"]] for tc in result.tool_trace]
+        assert outputs == [[a, b], [b, c]]
+
+    @pytest.mark.asyncio
+    async def test_empty_expand_is_not_merged_into_batch(self, mock_llm, mock_functions):
+        """Test that an expand without usable IDs gets expand_fn's own error, not an empty batch slice."""
+        valid = str(uuid.uuid4())
+
+        async def fake_expand(memory_ids, depth):
+            if not memory_ids:
+                return {"error": "memory_ids is required and must not be empty"}
+            if memory_ids == ["not-a-uuid"]:
+                return {"error": "No valid memory IDs provided", "details": {}}
+            results = [{"memory_id": mid, "memory": {"id": mid}} for mid in memory_ids]
+            return {"results": results, "count": len(results)}
+
+        mock_functions["expand_fn"] = AsyncMock(side_effect=fake_expand)
+        mock_llm.call_with_tools.side_effect = [
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(id="1", name="expand", arguments={"memory_ids": [], "depth": "chunk"}),
+                    LLMToolCall(id="2", name="expand", arguments={"memory_ids": [valid], "depth": "chunk"}),
+                    LLMToolCall(id="3", name="expand", arguments={"memory_ids": ["not-a-uuid"], "depth": "chunk"}),
+                ],
+                finish_reason="tool_calls",
+            ),
+            LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="4", name="done", arguments={"answer": "Test answer"})],
+                finish_reason="tool_calls",
+            ),
+        ]
+
+        result = await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            **mock_functions,
+        )
+
+        outputs = [tc.output for tc in result.tool_trace]
+        assert "error" in outputs[0]
+        assert outputs[1]["results"][0]["memory_id"] == valid
+        assert outputs[2]["error"] == "No valid memory IDs provided"
+
+    @pytest.mark.asyncio
+    async def test_expand_coalescer_passes_empty_call_through(self):
+        """Test that an empty expand batched with a valid one still gets expand_fn's error."""
+        import asyncio
+
+        from hindsight_api.engine.reflect.agent import _ExpandCoalescer
+
+        valid = str(uuid.uuid4())
+
+        async def fake_expand(memory_ids, depth):
+            if not memory_ids:
+                return {"error": "memory_ids is required and must not be empty"}
+            results = [{"memory_id": mid, "memory": {"id": mid}} for mid in memory_ids]
+            return {"results": results, "count": len(results)}
+
+        expand_fn = AsyncMock(side_effect=fake_expand)
+        coalescer = _ExpandCoalescer(expand_fn)
+
+        empty, found = await asyncio.gather(coalescer([], "chunk"), coalescer([valid], "chunk"))
+
+        assert empty == {"error": "memory_ids is required and must not be empty"}
+        assert found == {"results": [{"memory_id": valid, "memory": {"id": valid}}], "count": 1}
+
+    @pytest.mark.asyncio
+    async def test_final_prompt_skips_duplicate_tool_outputs(self, mock_llm, mock_functions):
+        """Test that repeated identical tool results appear once in the forced final prompt."""
+        mock_llm.call_with_tools.return_value = LLMToolCallResult(
+            tool_calls=[LLMToolCall(id="1", name="recall", arguments={"query": "test"})],
+            finish_reason="tool_calls",
+        )
+
+        result = await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            max_iterations=3,
+            **mock_functions,
+        )
+
+        assert result.text == "Fallback answer from final iteration"
+        assert len(result.tool_trace) == 2
+        final_prompt = mock_llm.call.call_args.kwargs["messages"][-1]["content"]
+        assert final_prompt.count("### From recall") == 1
+
+    @pytest.mark.asyncio
+    async def test_done_deduplicates_cited_ids(self, mock_llm, mock_functions):
+        """Test that repeated citations in done() are collapsed, keeping order."""
+        mock_llm.call_with_tools.side_effect = [
+            LLMToolCallResult(
+                tool_calls=[LLMToolCall(id="1", name="recall", arguments={"query": "test"})],
+                finish_reason="tool_calls",
+            ),
+            LLMToolCallResult(
+                tool_calls=[
+                    LLMToolCall(
+                        id="2",
+                        name="done",
+                        arguments={"answer": "Test answer", "memory_ids": ["mem-1", "unknown", "mem-1"]},
+                    )
+                ],
+                finish_reason="tool_calls",
+            ),
+        ]
+
+        result = await run_reflect_agent(
+            llm_config=mock_llm,
+            bank_id="test-bank",
+            query="test query",
+            bank_profile={"name": "Test", "mission": "Testing"},
+            **mock_functions,
+        )
+
+        assert result.used_memory_ids == ["mem-1"]
@@ -10,7 +10,7 @@ exception.
 Fix: initialise both variables to safe defaults before the try/finally block.
 """
 
-from datetime import datetime, timezone
+import uuid
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -19,7 +19,7 @@ import pytest
 @pytest.mark.asyncio
 async def test_recall_reranker_error_does_not_raise_unbound_local(memory, request_context):
     """Recall must propagate the reranker's exception, not an UnboundLocalError."""
-    bank_id = f"test_reranker_err_{datetime.now(timezone.utc).timestamp()}"
+    bank_id = f"test_reranker_err_{uuid.uuid4().hex[:12]}"
 
     try:
         await memory.retain_async(
@@ -29,10 +29,12 @@ async def test_recall_reranker_error_does_not_raise_unbound_local(memory, reques
         )
 
         # Simulate a reranker failure (e.g. Cohere API error on empty/small candidate set)
-        rerank_mock = AsyncMock(side_effect=RuntimeError("reranker API error"))
+        async def failing_rerank(*args, **kwargs):
+            raise RuntimeError("reranker API error")
+
         memory._cross_encoder_reranker._initialized = True  # skip ensure_initialized
 
-        with patch.object(memory._cross_encoder_reranker, "rerank", rerank_mock):
+        with patch.object(memory._cross_encoder_reranker, "rerank", failing_rerank):
             with pytest.raises(Exception, match="reranker API error"):
                 await memory.recall_async(
                     bank_id=bank_id,
@@ -47,7 +49,7 @@ async def test_recall_reranker_error_does_not_raise_unbound_local(memory, reques
 @pytest.mark.asyncio
 async def test_recall_reranker_init_error_does_not_raise_unbound_local(memory, request_context):
     """Same regression when ensure_initialized() raises (before pre_filtered_count is set)."""
-    bank_id = f"test_reranker_init_err_{datetime.now(timezone.utc).timestamp()}"
+    bank_id = f"test_reranker_init_err_{uuid.uuid4().hex[:12]}"
 
     try:
         await memory.retain_async(
@@ -56,10 +58,12 @@ async def test_recall_reranker_init_error_does_not_raise_unbound_local(memory, r
             request_context=request_context,
         )
 
-        init_mock = AsyncMock(side_effect=RuntimeError("reranker init failed"))
+        async def failing_ensure_initialized():
+            raise RuntimeError("reranker init failed")
+
         memory._cross_encoder_reranker._initialized = False
 
-        with patch.object(memory._cross_encoder_reranker, "ensure_initialized", init_mock):
+        with patch.object(memory._cross_encoder_reranker, "ensure_initialized", failing_ensure_initialized):
             with pytest.raises(Exception, match="reranker init failed"):
                 await memory.recall_async(
                     bank_id=bank_id,
@@ -69,3 +73,24 @@ async def test_recall_reranker_init_error_does_not_raise_unbound_local(memory, r
 
     finally:
         await memory.delete_bank(bank_id, request_context=request_context)
+
+
+@pytest.mark.asyncio
+async def test_rerank_single_candidate_is_scored_by_cross_encoder():
+    """A lone candidate still gets a real model score rather than a placeholder."""
+    import math
+
+    from hindsight_api.engine.search.reranking import CrossEncoderReranker
+    from hindsight_api.engine.search.types import MergedCandidate, RetrievalResult
+
+    cross_encoder = AsyncMock()
+    cross_encoder.predict.return_value = [2.0]
+    reranker = CrossEncoderReranker(cross_encoder=cross_encoder)
+    candidate = MergedCandidate(retrieval=RetrievalResult(id="m1", text="Paris", fact_type="world"), rrf_score=1.0)
+
+    results = await reranker.rerank("capital of France", [candidate])
+
+    cross_encoder.predict.assert_awaited_once_with([["capital of France", "Paris"]])
+    assert [r.id for r in results] == ["m1"]
+    assert results[0].cross_encoder_score == 2.0
+    assert results[0].cross_encoder_score_normalized == pytest.approx(1 / (1 + math.exp(-2.0)))
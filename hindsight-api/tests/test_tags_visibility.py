@@ -9,7 +9,8 @@ Use cases:
 
 The tags use OR-based matching: a memory matches if ANY of its tags overlap with the request tags.
 """
-from datetime import datetime
+import asyncio
+import uuid
 
 import httpx
 import pytest
@@ -66,7 +67,7 @@ class TestTagsWhereClauseBuilder:
 
     def test_tags_match_all_includes_untagged(self):
         """When match='all', should include untagged memories (NULL or empty)."""
-        result = build_tags_where_clause_simple(["user_a"], 5, match="all")
+        result = build_tags_where_clause_simple(["user_a", "user_b"], 5, match="all")
         # Should use OR with NULL/empty check
         assert "IS NULL" in result
         assert "= '{}'" in result
@@ -74,9 +75,18 @@ class TestTagsWhereClauseBuilder:
 
     def test_tags_match_all_uses_contains(self):
         """When match='all', should use contains operator (@>)."""
-        result = build_tags_where_clause_simple(["user_a"], 5, match="all")
+        result = build_tags_where_clause_simple(["user_a", "user_b"], 5, match="all")
         assert "@>" in result
 
+    def test_tags_match_all_single_tag_uses_overlap(self):
+        """A single tag under match='all' is the same test as overlap, so && is used."""
+        assert build_tags_where_clause_simple(["x"], 5, match="all") == build_tags_where_clause_simple(
+            ["x"], 5, match="any"
+        )
+        strict = build_tags_where_clause_simple(["x"], 5, match="all_strict")
+        assert "tags && $5" in strict
+        assert "IS NOT NULL" in strict
+
     # ---- Test "any_strict" mode (OR, excludes untagged) ----
 
     def test_tags_match_any_strict_excludes_untagged(self):
@@ -98,7 +108,7 @@ class TestTagsWhereClauseBuilder:
 
     def test_tags_match_all_strict_excludes_untagged(self):
         """When match='all_strict', should exclude untagged memories."""
-        result = build_tags_where_clause_simple(["user_a"], 5, match="all_strict")
+        result = build_tags_where_clause_simple(["user_a", "user_b"], 5, match="all_strict")
         # Should require tags to be NOT NULL and not empty
         assert "IS NOT NULL" in result
         assert "!= '{}'" in result
@@ -106,7 +116,7 @@ class TestTagsWhereClauseBuilder:
 
     def test_tags_match_all_strict_uses_contains(self):
         """When match='all_strict', should use contains operator (@>)."""
-        result = build_tags_where_clause_simple(["user_a"], 5, match="all_strict")
+        result = build_tags_where_clause_simple(["user_a", "user_b"], 5, match="all_strict")
         assert "@>" in result
 
     # ---- Test table alias with all modes ----
@@ -251,7 +261,7 @@ async def api_client(memory):
 @pytest.fixture
 def test_bank_id():
     """Provide a unique bank ID for this test run."""
-    return f"tags_test_{datetime.now().timestamp()}"
+    return f"tags_test_{uuid.uuid4().hex[:12]}"
 
 
 @pytest.mark.asyncio
@@ -516,7 +526,7 @@ async def test_multi_user_agent_visibility(api_client):
     - User B should only see memories from rooms 2 and 3
     - Agent (no filter) should see all memories
     """
-    bank_id = f"multi_user_test_{datetime.now().timestamp()}"
+    bank_id = f"multi_user_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories from different chat rooms
     response = await api_client.post(
@@ -534,39 +544,36 @@ async def test_multi_user_agent_visibility(api_client):
     )
     assert response.status_code == 200
 
-    # User A queries - should see their private chat and group chat
-    response = await api_client.post(
-        f"/v1/default/banks/{bank_id}/memories/recall",
-        json={"query": "What meeting time preferences were discussed?", "budget": "low", "tags": ["user_a"]}
+    # User A, User B and the agent (no filter) query independently, so run the recalls concurrently
+    recall_url = f"/v1/default/banks/{bank_id}/memories/recall"
+    query = "What meeting time preferences were discussed?"
+    user_a_response, user_b_response, agent_response = await asyncio.gather(
+        api_client.post(recall_url, json={"query": query, "budget": "low", "tags": ["user_a"]}),
+        api_client.post(recall_url, json={"query": query, "budget": "low", "tags": ["user_b"]}),
+        api_client.post(recall_url, json={"query": query, "budget": "low"}),  # No tags
     )
-    assert response.status_code == 200
-    user_a_results = response.json()["results"]
+
+    # User A should see their private chat and group chat
+    assert user_a_response.status_code == 200
+    user_a_results = user_a_response.json()["results"]
     user_a_texts = [r["text"] for r in user_a_results]
 
     assert any("morning" in t for t in user_a_texts), "User A should see their own preference (morning)"
     assert any("noon" in t for t in user_a_texts), "User A should see group chat (noon)"
     assert not any("afternoon" in t for t in user_a_texts), "User A should NOT see User B's private preference"
 
-    # User B queries - should see their private chat and group chat
-    response = await api_client.post(
-        f"/v1/default/banks/{bank_id}/memories/recall",
-        json={"query": "What meeting time preferences were discussed?", "budget": "low", "tags": ["user_b"]}
-    )
-    assert response.status_code == 200
-    user_b_results = response.json()["results"]
+    # User B should see their private chat and group chat
+    assert user_b_response.status_code == 200
+    user_b_results = user_b_response.json()["results"]
     user_b_texts = [r["text"] for r in user_b_results]
 
     assert any("afternoon" in t for t in user_b_texts), "User B should see their own preference (afternoon)"
     assert any("noon" in t for t in user_b_texts), "User B should see group chat (noon)"
     assert not any("morning" in t for t in user_b_texts), "User B should NOT see User A's private preference"
 
-    # Agent queries (no filter) - should see everything
-    response = await api_client.post(
-        f"/v1/default/banks/{bank_id}/memories/recall",
-        json={"query": "What meeting time preferences were discussed?", "budget": "low"}  # No tags
-    )
-    assert response.status_code == 200
-    agent_results = response.json()["results"]
+    # Agent should see everything
+    assert agent_response.status_code == 200
+    agent_results = agent_response.json()["results"]
     agent_texts = [r["text"] for r in agent_results]
 
     assert any("morning" in t for t in agent_texts), "Agent should see User A's preference"
@@ -585,7 +592,7 @@ async def test_student_tracking_visibility(api_client):
     - Student A should only see their own data
     - Teacher (no filter) should see all student data
     """
-    bank_id = f"student_test_{datetime.now().timestamp()}"
+    bank_id = f"student_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories for different students
     response = await api_client.post(
@@ -600,26 +607,25 @@ async def test_student_tracking_visibility(api_client):
     )
     assert response.status_code == 200
 
-    # Student A queries - should only see their own data
-    response = await api_client.post(
-        f"/v1/default/banks/{bank_id}/memories/recall",
-        json={"query": "How am I doing in class?", "budget": "low", "tags": ["student_a"]}
+    # Student A and the teacher (no filter) query independently, so run the recalls concurrently
+    recall_url = f"/v1/default/banks/{bank_id}/memories/recall"
+    student_a_response, teacher_response = await asyncio.gather(
+        api_client.post(recall_url, json={"query": "How am I doing in class?", "budget": "low", "tags": ["student_a"]}),
+        api_client.post(recall_url, json={"query": "Which students need help?", "budget": "low"}),  # No tags
     )
-    assert response.status_code == 200
-    student_a_results = response.json()["results"]
+
+    # Student A should only see their own data
+    assert student_a_response.status_code == 200
+    student_a_results = student_a_response.json()["results"]
     student_a_texts = [r["text"] for r in student_a_results]
 
     assert any("algebra" in t for t in student_a_texts), "Student A should see their algebra progress"
     assert any("participated" in t for t in student_a_texts), "Student A should see their participation"
     assert not any("Student B" in t or "geometry" in t for t in student_a_texts), "Student A should NOT see Student B's data"
 
-    # Teacher queries (no filter) - should see all students
-    response = await api_client.post(
-        f"/v1/default/banks/{bank_id}/memories/recall",
-        json={"query": "Which students need help?", "budget": "low"}  # No tags
-    )
-    assert response.status_code == 200
-    teacher_results = response.json()["results"]
+    # Teacher should see all students
+    assert teacher_response.status_code == 200
+    teacher_results = teacher_response.json()["results"]
     teacher_texts = [r["text"] for r in teacher_results]
 
     assert any("Student A" in t for t in teacher_texts), "Teacher should see Student A's data"
@@ -639,7 +645,7 @@ async def test_list_tags_returns_all_tags(api_client):
     Observations inherit tags from their source facts (for visibility security),
     so counts may be higher than the number of stored memories.
     """
-    bank_id = f"list_tags_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories with various tags
     response = await api_client.post(
@@ -685,7 +691,7 @@ async def test_list_tags_returns_all_tags(api_client):
 @pytest.mark.asyncio
 async def test_list_tags_with_wildcard_prefix(api_client):
     """Test that list_tags filters with prefix wildcard pattern (user:*)."""
-    bank_id = f"list_tags_wildcard_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_wildcard_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories with various tags
     response = await api_client.post(
@@ -720,7 +726,7 @@ async def test_list_tags_with_wildcard_prefix(api_client):
 @pytest.mark.asyncio
 async def test_list_tags_with_wildcard_suffix(api_client):
     """Test that list_tags filters with suffix wildcard pattern (*-admin)."""
-    bank_id = f"list_tags_suffix_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_suffix_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories with various tags - use meaningful content for reliable fact extraction
     response = await api_client.post(
@@ -753,7 +759,7 @@ async def test_list_tags_with_wildcard_suffix(api_client):
 @pytest.mark.asyncio
 async def test_list_tags_with_wildcard_middle(api_client):
     """Test that list_tags filters with middle wildcard pattern (env*-prod)."""
-    bank_id = f"list_tags_middle_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_middle_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories with various tags - use meaningful content for fact extraction
     response = await api_client.post(
@@ -786,7 +792,7 @@ async def test_list_tags_with_wildcard_middle(api_client):
 @pytest.mark.asyncio
 async def test_list_tags_case_insensitive(api_client):
     """Test that list_tags wildcard matching is case-insensitive."""
-    bank_id = f"list_tags_case_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_case_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories with mixed case tags - use meaningful content
     response = await api_client.post(
@@ -815,7 +821,7 @@ async def test_list_tags_case_insensitive(api_client):
 @pytest.mark.asyncio
 async def test_list_tags_pagination(api_client):
     """Test that list_tags supports pagination."""
-    bank_id = f"list_tags_pagination_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_pagination_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories with many tags - use meaningful content for fact extraction
     names = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry", "Ivan", "Julia"]
@@ -849,7 +855,7 @@ async def test_list_tags_pagination(api_client):
 @pytest.mark.asyncio
 async def test_list_tags_empty_bank(api_client):
     """Test that list_tags returns empty for bank with no tags."""
-    bank_id = f"list_tags_empty_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_empty_test_{uuid.uuid4().hex[:12]}"
 
     # List tags without storing anything
     response = await api_client.get(f"/v1/default/banks/{bank_id}/tags")
@@ -863,7 +869,7 @@ async def test_list_tags_empty_bank(api_client):
 @pytest.mark.asyncio
 async def test_list_tags_ordered_by_count(api_client):
     """Test that list_tags returns tags ordered by frequency (most used first)."""
-    bank_id = f"list_tags_order_test_{datetime.now().timestamp()}"
+    bank_id = f"list_tags_order_test_{uuid.uuid4().hex[:12]}"
 
     # Store memories with tags having different frequencies - use meaningful content
     response = await api_client.post(
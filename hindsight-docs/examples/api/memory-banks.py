@@ -4,7 +4,6 @@ Memory Banks API examples for Hindsight.
 Run: python examples/api/memory-banks.py
 """
 import os
-import requests
 
 HINDSIGHT_URL = os.getenv("HINDSIGHT_API_URL", "http://localhost:8888")
 
@@ -67,7 +66,8 @@ client.reset_bank_config("my-bank")
 # =============================================================================
 # Cleanup (not shown in docs)
 # =============================================================================
-requests.delete(f"{HINDSIGHT_URL}/v1/default/banks/my-bank")
-requests.delete(f"{HINDSIGHT_URL}/v1/default/banks/architect-bank")
+client.delete_bank(bank_id="my-bank")
+client.delete_bank(bank_id="architect-bank")
+client.close()
 
 print("memory-banks.py: All examples passed")
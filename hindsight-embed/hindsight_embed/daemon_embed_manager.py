@@ -5,9 +5,11 @@ This module provides the production implementation of the embed management inter
 consolidating daemon lifecycle, profile management, and database URL resolution.
 """
 
+import atexit
 import logging
 import os
 import re
+import select
 import subprocess
 import time
 from pathlib import Path
@@ -30,7 +32,42 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # Constants
 DAEMON_STARTUP_TIMEOUT = 180  # seconds
+DAEMON_POLL_INITIAL_INTERVAL = 0.05  # seconds, doubled after each unanswered probe
+DAEMON_POLL_MAX_INTERVAL = 0.5  # seconds
 DEFAULT_DAEMON_IDLE_TIMEOUT = 300  # 5 minutes
+DAEMON_STOP_TIMEOUT = 5.0  # seconds
+
+
+def _wait_for_exit(pid: int, timeout: float) -> None:
+    """Block until the process exits or the timeout elapses.
+
+    Uses a pidfd where the platform has one (Linux 5.3+), which becomes readable as soon as
+    the process exits; otherwise falls back to probing with signal 0, starting at 1 ms and
+    backing off geometrically so a prompt exit is noticed within a few milliseconds.
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return
+        except OSError:
+            pass  # pidfd unsupported by this kernel, use the probe loop
+        else:
+            try:
+                select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            return
+
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 0.1)
 
 
 class DaemonEmbedManager(EmbedManager):
@@ -39,6 +76,7 @@ class DaemonEmbedManager(EmbedManager):
     def __init__(self):
         """Initialize the daemon embed manager."""
         self._profile_manager = ProfileManager()
+        self._health_client: httpx.Client | None = None
 
     def _sanitize_profile_name(self, profile: str | None) -> str:
         """Sanitize profile name for use in database names and file paths."""
@@ -78,13 +116,28 @@ class DaemonEmbedManager(EmbedManager):
         paths = self._profile_manager.resolve_profile_paths(profile)
         return f"http://127.0.0.1:{paths.port}"
 
+    def _get_health_client(self) -> httpx.Client:
+        """Get the HTTP client used for health probes, creating it on first use.
+
+        Startup polls the daemon repeatedly, so the client is kept for the life of the
+        process and its loopback connection is reused across probes.
+        """
+        if self._health_client is None:
+            # Loopback connects either succeed or are refused almost instantly, so a stalled
+            # connect is cut short; reads keep the longer budget for a daemon busy loading models.
+            self._health_client = httpx.Client(
+                timeout=httpx.Timeout(2.0, connect=0.5),
+                limits=httpx.Limits(max_keepalive_connections=1, keepalive_expiry=15.0),
+            )
+            atexit.register(self._health_client.close)
+        return self._health_client
+
     def is_running(self, profile: str) -> bool:
         """Check if daemon is running and responsive."""
         daemon_url = self.get_url(profile)
         try:
-            with httpx.Client(timeout=2) as client:
-                response = client.get(f"{daemon_url}/health")
-                return response.status_code == 200
+            response = self._get_health_client().get(f"{daemon_url}/health")
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -117,8 +170,6 @@ class DaemonEmbedManager(EmbedManager):
 
         # Build environment with LLM config
         # Support both formats: simple keys ("llm_api_key") and env var format ("HINDSIGHT_API_LLM_API_KEY")
-        env = os.environ.copy()
-
         # Map of simple key -> env var key
         key_mapping = {
             "llm_api_key": "HINDSIGHT_API_LLM_API_KEY",
@@ -129,11 +180,15 @@ class DaemonEmbedManager(EmbedManager):
             "idle_timeout": "HINDSIGHT_EMBED_DAEMON_IDLE_TIMEOUT",
         }
 
+        overrides = {}
         for simple_key, env_key in key_mapping.items():
             # Check both simple format and env var format
             value = config.get(simple_key) or config.get(env_key)
             if value:
-                env[env_key] = str(value)
+                overrides[env_key] = str(value)
+
+        # Single merge of the inherited environment with the config overrides
+        env = os.environ | overrides
 
         # Use profile-specific database (check config for override)
         db_override = config.get("HINDSIGHT_EMBED_API_DATABASE_URL") or env.get("HINDSIGHT_EMBED_API_DATABASE_URL")
@@ -188,6 +243,7 @@ class DaemonEmbedManager(EmbedManager):
             start_time = time.time()
             last_check_time = start_time
             last_log_position = 0
+            poll_interval = DAEMON_POLL_INITIAL_INTERVAL
             log_lines = [f"Starting daemon for {profile_label}...", ""]
 
             title = f"[bold cyan]Starting Daemon[/bold cyan] [dim]({profile} @ :{port})[/dim]"
@@ -267,7 +323,8 @@ class DaemonEmbedManager(EmbedManager):
                     panel = Panel(content, title=title, border_style="cyan", padding=(1, 2))
                     live.update(panel)
                     live.refresh()
-                    time.sleep(0.5)
+                    time.sleep(poll_interval)
+                    poll_interval = min(poll_interval * 2, DAEMON_POLL_MAX_INTERVAL)
 
             # Timeout
             log_lines.append("")
@@ -357,12 +414,7 @@ class DaemonEmbedManager(EmbedManager):
                 os.kill(pid, 15)
 
                 # Wait for process to exit
-                for _ in range(50):
-                    time.sleep(0.1)
-                    try:
-                        os.kill(pid, 0)
-                    except OSError:
-                        break
+                _wait_for_exit(pid, DAEMON_STOP_TIMEOUT)
             else:
                 logger.warning(f"Could not find PID for port {port}")
         except (subprocess.TimeoutExpired, ValueError, OSError, FileNotFoundError) as e: